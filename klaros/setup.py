@@ -0,0 +1,23 @@
+"""
+Build hook for the optional Cython fast path.
+
+All project metadata lives in pyproject.toml. This file only declares the
+_chatgpt_fast extension, marked optional so installs without a C compiler
+fall back to the pure-Python loader instead of failing.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ["src/klaros/loaders/_chatgpt_fast.pyx"],
+        compiler_directives={"language_level": "3str"},
+    )
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
@@ -4,21 +4,25 @@ Klaros CLI - Liberate your digital context.
 A local-first CLI tool to convert AI chat exports into universal formats.
 """
 
+import os
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, List, Optional
 from enum import Enum
 
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 from rich import print as rprint
 
 from klaros import __version__
-from klaros.models import SourcePlatform, ConversionStats
-from klaros.loaders import get_loader
-from klaros.processors import CleanerService, PrivacyService, TaggerService
+from klaros.models import SourcePlatform, ConversionStats, UniversalChat
+from klaros.loaders import BaseLoader, get_loader
+from klaros.processors import CleanerService, PrivacyService, TaggerService, FusedProcessor
 from klaros.exporters import get_exporter
 
 
@@ -33,6 +37,11 @@ app = typer.Typer(
 
 console = Console()
 
+# Raw conversations sent to a worker per task, and tasks kept in flight per
+# worker. Bounding the window keeps memory flat on streamed exports.
+WORKER_BATCH_SIZE = 16
+WORKER_QUEUE_DEPTH = 4
+
 
 class OutputFormat(str, Enum):
     """Supported output formats."""
@@ -47,6 +56,87 @@ class SourceType(str, Enum):
     CLAUDE = "claude"
 
 
+class _ReadError(Exception):
+    """An error raised while reading the export; the original is __cause__."""
+
+
+def _read_raw(loader: BaseLoader, input_file: Path) -> Iterator[dict[str, Any]]:
+    """Stream raw conversations, tagging any failure as a _ReadError."""
+    try:
+        yield from loader.iter_raw(input_file)
+    except Exception as e:
+        raise _ReadError(str(e)) from e
+
+
+def _process_raw(
+    loader: BaseLoader,
+    processor: FusedProcessor,
+    conv: dict[str, Any],
+    source_file: str
+) -> Optional[UniversalChat]:
+    """Parse one raw conversation and run it through the processor."""
+    chat = loader.parse_conversation(conv, source_file)
+    if not chat or not chat.messages:
+        return None
+    
+    return processor.process(chat)
+
+
+# Per-process state for pool workers, set once by _init_worker
+_worker_loader: Optional[BaseLoader] = None
+_worker_processor: Optional[FusedProcessor] = None
+
+
+def _init_worker(loader: BaseLoader, processor: FusedProcessor) -> None:
+    """Install the loader and processor in a freshly started worker."""
+    global _worker_loader, _worker_processor
+    _worker_loader = loader
+    _worker_processor = processor
+
+
+def _process_batch(batch: List[dict[str, Any]], source_file: str) -> List[Optional[UniversalChat]]:
+    """Worker entry point: process a batch of raw conversations."""
+    return [_process_raw(_worker_loader, _worker_processor, conv, source_file) for conv in batch]
+
+
+def _iter_processed(
+    loader: BaseLoader,
+    processor: FusedProcessor,
+    input_file: Path,
+    workers: int
+) -> Iterator[Optional[UniversalChat]]:
+    """
+    Parse and process every conversation in the export, in file order.
+    
+    Yields one result per raw conversation: the processed chat, or None
+    when the conversation was unparseable or empty. With more than one
+    worker, batches are fanned out to a process pool; the serial path is
+    used when there are fewer than two conversations.
+    """
+    source_file = str(input_file)
+    raw_convs = _read_raw(loader, input_file)
+    head = list(islice(raw_convs, 2))
+    
+    if workers < 2 or len(head) < 2:
+        for conv in chain(head, raw_convs):
+            yield _process_raw(loader, processor, conv, source_file)
+        return
+    
+    batches = iter(lambda: list(islice(raw_convs, WORKER_BATCH_SIZE)), [])
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(loader, processor)
+    ) as pool:
+        pending = deque([pool.submit(_process_batch, head, source_file)])
+        for batch in batches:
+            pending.append(pool.submit(_process_batch, batch, source_file))
+            if len(pending) >= workers * WORKER_QUEUE_DEPTH:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
 @app.command()
 def convert(
     input_file: Path = typer.Argument(
@@ -84,6 +174,12 @@ def convert(
         True,
         "--clean/--no-clean",
         help="Remove boilerplate and normalize whitespace"
+    ),
+    workers: int = typer.Option(
+        0,
+        "--workers", "-w",
+        min=0,
+        help="Worker processes for parsing (0 = one per CPU, 1 = no parallelism)"
     )
 ):
     """
@@ -108,17 +204,12 @@ def convert(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
     
-    # Initialize processors
-    processors = []
-    
-    if clean:
-        processors.append(CleanerService())
-    
-    if redact_pii:
-        processors.append(PrivacyService())
-    
-    if extract_tags:
-        processors.append(TaggerService())
+    # Initialize processors as a single fused pass
+    processor = FusedProcessor(
+        cleaner=CleanerService() if clean else None,
+        privacy=PrivacyService() if redact_pii else None,
+        tagger=TaggerService() if extract_tags else None
+    )
     
     # Initialize exporter
     try:
@@ -127,56 +218,49 @@ def convert(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
     
-    # Count conversations for progress bar
-    console.print(f"[dim]📂 Reading {input_file.name}...[/dim]")
-    try:
-        total_conversations = loader.count_conversations(input_file)
-    except Exception as e:
-        console.print(f"[red]Error reading file:[/red] {e}")
-        raise typer.Exit(1)
-    
-    console.print(f"[green]✓[/green] Found {total_conversations} conversations\n")
-    
-    # Process conversations
-    processed_chats = []
+    # Process conversations and stream them straight to the exporter.
+    # The export is read in a single pass, so the total is not known up
+    # front and progress is shown as a running count.
     stats = ConversionStats(source_platform=platform, output_format=format.value)
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console
-    ) as progress:
-        task = progress.add_task("Processing...", total=total_conversations)
-        
-        for chat in loader.load(input_file):
-            stats.total_conversations += 1
-            
-            # Apply processors
-            for processor in processors:
-                chat = processor.process(chat)
-            
-            # Skip empty chats after processing
-            if not chat.messages:
-                stats.skipped_empty += 1
-                progress.advance(task)
-                continue
-            
-            stats.total_messages += len(chat.messages)
-            processed_chats.append(chat)
-            progress.advance(task)
-    
-    # Export
-    console.print(f"\n[dim]💾 Exporting to {format.value}...[/dim]")
+    console.print(f"[dim]📂 Reading {input_file.name}...[/dim]")
+    console.print(f"[dim]💾 Exporting to {format.value}...[/dim]\n")
     
     try:
-        exporter.export(processed_chats, output)
-        console.print(f"[green]✓[/green] Exported to {output}")
+        with exporter.open_sink(output) as sink, Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TextColumn("[dim]{task.completed} conversations[/dim]"),
+            console=console
+        ) as progress:
+            task = progress.add_task("Processing...", total=None)
+            
+            for chat in _iter_processed(loader, processor, input_file, workers or os.cpu_count() or 1):
+                # Unparseable or empty source conversation
+                if chat is None:
+                    progress.advance(task)
+                    continue
+                
+                stats.total_conversations += 1
+                
+                # Skip empty chats after processing
+                if not chat.messages:
+                    stats.skipped_empty += 1
+                    progress.advance(task)
+                    continue
+                
+                stats.total_messages += len(chat.messages)
+                exporter.write_incremental(chat, sink)
+                progress.advance(task)
+    except _ReadError as e:
+        console.print(f"[red]Error reading file:[/red] {e}")
+        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]Error exporting:[/red] {e}")
         raise typer.Exit(1)
     
+    console.print(f"\n[green]✓[/green] Exported to {output}")
+    
     # Stats
     stats.processing_time_seconds = time.time() - start_time
     
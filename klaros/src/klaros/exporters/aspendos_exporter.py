@@ -1,17 +1,47 @@
 """Aspendos exporter - Pre-optimized format for Aspendos Memory Cloud."""
 
-import json
+import shutil
+import tempfile
+from bisect import bisect_right
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import accumulate
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Any
+from typing import IO, List, Any, Iterator, Tuple
 
-from klaros.models import UniversalChat
-from klaros.exporters.base import BaseExporter
+from klaros.models import UniversalChat, MessageRole
+from klaros.exporters.base import BaseExporter, WRITE_BUFFER_SIZE, dumps_json, open_atomic
 
 
 # Approximate tokens per character (conservative estimate)
 CHARS_PER_TOKEN = 4
 
+MESSAGE_TEXT = attrgetter('text')
+MESSAGE_ID = attrgetter('id')
+
+# Serialized chunk layout, matching a minified dump of _build_chunk's dict.
+# Only the text and message ids are encoded per chunk; conversation id and
+# tags are encoded once per conversation.
+CHUNK_TEMPLATE = (
+    b'{"chunk_id":"chunk_%d","conversation_id":%s,"text":%s,'
+    b'"message_ids":%s,"tags":%s,"token_estimate":%d}'
+)
+
+# Chunk text prefix per role, e.g. "[USER]: "
+ROLE_PREFIXES = {role: f"[{role.name}]: " for role in MessageRole}
+ROLE_PREFIX_LENGTHS = {role: len(prefix) for role, prefix in ROLE_PREFIXES.items()}
+
+
+@dataclass
+class _AspendosSink:
+    """Open Aspendos export: output file, chunk spool and counters."""
+    file: IO[bytes]
+    chunks: IO[bytes]
+    conversation_count: int = 0
+    next_chunk_id: int = 0
+
 
 class AspendosExporter(BaseExporter):
     """
@@ -42,12 +72,17 @@ class AspendosExporter(BaseExporter):
         self.include_metadata = include_metadata
         self.max_chars = chunk_size * CHARS_PER_TOKEN
     
-    def export(self, chats: List[UniversalChat], output_path: Path) -> None:
+    @contextmanager
+    def open_sink(self, output_path: Path) -> Iterator[_AspendosSink]:
         """
-        Export conversations to Aspendos-optimized JSON.
+        Open an Aspendos export for incremental writing.
+        
+        Conversations are streamed straight into the output file. Chunks
+        must follow all conversations in the document, so they are spooled
+        to a temporary file and appended when the context exits. The
+        output only replaces output_path once the export completes.
         
         Args:
-            chats: List of conversations to export
             output_path: Path to write output file
         """
         # Ensure .json extension
@@ -56,35 +91,57 @@ class AspendosExporter(BaseExporter):
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Build export data
-        export_data = {
-            "_meta": {
-                "format": "aspendos-memory-v1",
-                "generator": "klaros",
-                "generated_at": datetime.now().isoformat(),
-                "chunk_size": self.chunk_size,
-                "note": "This format is pre-optimized for Aspendos Memory Cloud. "
-                        "It reduces import processing time by 90%."
-            },
-            "conversations": [],
-            "chunks": []
+        meta = {
+            "format": "aspendos-memory-v1",
+            "generator": "klaros",
+            "generated_at": datetime.now().isoformat(),
+            "chunk_size": self.chunk_size,
+            "note": "This format is pre-optimized for Aspendos Memory Cloud. "
+                    "It reduces import processing time by 90%."
         }
         
-        chunk_id = 0
-        
-        for chat in chats:
-            # Add conversation metadata
-            conv_data = self._chat_to_aspendos(chat)
-            export_data["conversations"].append(conv_data)
+        with open_atomic(output_path) as f, \
+                tempfile.TemporaryFile('w+b', buffering=WRITE_BUFFER_SIZE) as spool:
+            sink = _AspendosSink(file=f, chunks=spool)
             
-            # Create chunks
-            chunks = self._create_chunks(chat, chunk_id)
-            export_data["chunks"].extend(chunks)
-            chunk_id += len(chunks)
-        
-        # Write minified JSON
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, separators=(',', ':'), default=self._json_serializer)
+            # Write minified JSON
+            f.write(b'{"_meta":')
+            f.write(self._dumps(meta))
+            f.write(b',"conversations":[')
+            yield sink
+            f.write(b'],"chunks":[')
+            spool.seek(0)
+            shutil.copyfileobj(spool, f)
+            f.write(b']}')
+    
+    def write_incremental(self, chat: UniversalChat, sink: _AspendosSink) -> None:
+        """
+        Write one conversation and spool its chunks.
+        
+        Args:
+            chat: Conversation to export
+            sink: Sink yielded by open_sink
+        """
+        # Add conversation metadata
+        if sink.conversation_count:
+            sink.file.write(b',')
+        sink.file.write(self._dumps(self._chat_to_aspendos(chat)))
+        sink.conversation_count += 1
+        
+        # Stream chunks as they are built
+        conversation_id = dumps_json(chat.id)
+        tags = dumps_json(chat.tags)
+        for text, message_ids in self._iter_windows(chat):
+            if sink.next_chunk_id:
+                sink.chunks.write(b',')
+            sink.chunks.write(self._encode_chunk(
+                sink.next_chunk_id, conversation_id, text, message_ids, tags
+            ))
+            sink.next_chunk_id += 1
+    
+    def _dumps(self, obj: Any) -> bytes:
+        """Serialize to minified JSON bytes."""
+        return dumps_json(obj, default=self._json_serializer)
     
     def export_single(self, chat: UniversalChat) -> str:
         """
@@ -103,10 +160,10 @@ class AspendosExporter(BaseExporter):
                 "chunk_size": self.chunk_size
             },
             "conversations": [self._chat_to_aspendos(chat)],
-            "chunks": self._create_chunks(chat, 0)
+            "chunks": list(self._iter_chunks(chat, 0))
         }
         
-        return json.dumps(export_data, separators=(',', ':'), default=self._json_serializer)
+        return self._dumps(export_data).decode('utf-8')
     
     def _chat_to_aspendos(self, chat: UniversalChat) -> dict[str, Any]:
         """Convert chat to Aspendos conversation metadata."""
@@ -120,51 +177,55 @@ class AspendosExporter(BaseExporter):
             "estimated_tokens": self._estimate_tokens(chat)
         }
     
-    def _create_chunks(self, chat: UniversalChat, start_id: int) -> List[dict]:
+    def _iter_chunks(self, chat: UniversalChat, start_id: int) -> Iterator[dict]:
         """
         Split conversation into token-limited chunks.
         
         Each chunk is a self-contained unit that can be embedded
         separately in Aspendos's vector database.
         """
-        chunks = []
-        current_chunk_text = []
-        current_chunk_messages = []
-        current_length = 0
-        
-        for msg in chat.messages:
-            msg_text = f"[{msg.role.upper()}]: {msg.text}"
-            msg_length = len(msg_text)
-            
-            # Check if adding this message would exceed chunk size
-            if current_length + msg_length > self.max_chars and current_chunk_text:
-                # Save current chunk
-                chunks.append(self._build_chunk(
-                    chunk_id=start_id + len(chunks),
-                    conversation_id=chat.id,
-                    text="\n\n".join(current_chunk_text),
-                    message_ids=[m.id for m in current_chunk_messages],
-                    tags=chat.tags
-                ))
-                current_chunk_text = []
-                current_chunk_messages = []
-                current_length = 0
-            
-            current_chunk_text.append(msg_text)
-            current_chunk_messages.append(msg)
-            current_length += msg_length
-        
-        # Don't forget the last chunk
-        if current_chunk_text:
-            chunks.append(self._build_chunk(
-                chunk_id=start_id + len(chunks),
+        for chunk_id, (text, message_ids) in enumerate(self._iter_windows(chat), start_id):
+            yield self._build_chunk(
+                chunk_id=chunk_id,
                 conversation_id=chat.id,
-                text="\n\n".join(current_chunk_text),
-                message_ids=[m.id for m in current_chunk_messages],
+                text=text,
+                message_ids=message_ids,
                 tags=chat.tags
-            ))
+            )
+    
+    def _iter_windows(self, chat: UniversalChat) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Yield (text, message_ids) for each chunk of a conversation.
+        
+        Boundaries come from a prefix sum of message lengths, so each
+        chunk's extent is found by binary search rather than a running
+        total. Chunks are yielded one at a time.
+        """
+        messages = chat.messages
         
-        return chunks
+        # prefix[i] is the combined formatted length of messages[0..i]; a
+        # chunk starting at `start` extends to the last message that fits.
+        # Formatted text is only built for the chunk being emitted.
+        prefix = list(accumulate(
+            ROLE_PREFIX_LENGTHS[msg.role] + len(msg.text) for msg in messages
+        ))
+        
+        start = 0
+        base = 0
+        
+        while start < len(messages):
+            end = bisect_right(prefix, base + self.max_chars, lo=start)
+            # A message longer than the limit still gets a chunk of its own
+            if end == start:
+                end = start + 1
+            window = messages[start:end]
+            
+            yield (
+                "\n\n".join([ROLE_PREFIXES[m.role] + m.text for m in window]),
+                list(map(MESSAGE_ID, window)),
+            )
+            base = prefix[end - 1]
+            start = end
     
     def _build_chunk(
         self,
@@ -184,9 +245,43 @@ class AspendosExporter(BaseExporter):
             "token_estimate": len(text) // CHARS_PER_TOKEN
         }
     
+    def _encode_chunk(
+        self,
+        chunk_id: int,
+        conversation_id: bytes,
+        text: str,
+        message_ids: List[str],
+        tags: bytes
+    ) -> bytes:
+        """
+        Serialize a chunk straight to minified JSON bytes.
+        
+        Produces the same JSON as dumping _build_chunk's dict, without
+        building the dict; keep the two in sync.
+        
+        Args:
+            chunk_id: Sequential chunk number
+            conversation_id: JSON-encoded conversation id
+            text: Chunk text
+            message_ids: Ids of the messages in the chunk
+            tags: JSON-encoded conversation tags
+            
+        Returns:
+            Chunk object as JSON bytes
+        """
+        return CHUNK_TEMPLATE % (
+            chunk_id,
+            conversation_id,
+            dumps_json(text),
+            dumps_json(message_ids),
+            tags,
+            len(text) // CHARS_PER_TOKEN,
+        )
+    
     def _estimate_tokens(self, chat: UniversalChat) -> int:
         """Estimate total tokens in conversation."""
-        total_chars = sum(len(msg.text) for msg in chat.messages)
+        # map() keeps the per-message attribute access and len() in C
+        total_chars = sum(map(len, map(MESSAGE_TEXT, chat.messages)))
         return total_chars // CHARS_PER_TOKEN
     
     def _json_serializer(self, obj: Any) -> Any:
@@ -1,28 +1,203 @@
 """Base exporter interface for output formats."""
 
+import json
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
-from typing import List
+from typing import IO, Any, Callable, Deque, Iterable, Iterator, Optional
 
 from klaros.models import UniversalChat
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Buffer size for streamed export files; large buffers keep the many small
+# item/separator writes from each becoming a write() syscall
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Threads used to overlap per-file writes with rendering
+WRITE_WORKERS = 16
+
+# Writes queued per thread before rendering waits for the disk
+WRITE_QUEUE_DEPTH = 2
+
+
+def _default_file_mode() -> int:
+    """Permission bits open() gives new files under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Mode for atomically written outputs. Read once at import: reading the
+# umask means briefly changing it, which would affect files other threads
+# create in the meantime.
+OUTPUT_FILE_MODE = _default_file_mode()
+
+
+def dumps_json(
+    obj: Any,
+    pretty: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and the stdlib json module otherwise
+    (or when orjson rejects the input, e.g. a string with lone surrogates).
+    Both produce two-space indentation when pretty and compact separators
+    when not; orjson keeps non-ASCII text as UTF-8 instead of escaping it.
+    
+    Args:
+        obj: Object to serialize
+        pretty: Indent output by two spaces
+        default: Fallback serializer for unsupported types
+        
+    Returns:
+        JSON document as bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except orjson.JSONEncodeError:
+            pass
+    
+    if pretty:
+        text = json.dumps(obj, indent=2, default=default)
+    else:
+        text = json.dumps(obj, separators=(',', ':'), default=default)
+    return text.encode('utf-8')
+
+
+@contextmanager
+def open_atomic(output_path: Path) -> Iterator[IO[bytes]]:
+    """
+    Open a buffered binary file that replaces output_path on success.
+    
+    Output goes to a temporary file in the same directory, which is
+    renamed over output_path only when the context exits cleanly. On
+    error the temporary file is removed, so a failed export never leaves
+    a truncated file behind or clobbers an earlier good one.
+    
+    Args:
+        output_path: Final path of the output file
+        
+    Yields:
+        File object to write the output to
+    """
+    fd, temp_name = tempfile.mkstemp(
+        dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp"
+    )
+    try:
+        # mkstemp creates the file owner-only; give the output the mode a
+        # plain open() would have
+        os.fchmod(fd, OUTPUT_FILE_MODE)
+        with open(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+        os.replace(temp_name, output_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+class BackgroundWriter:
+    """
+    Runs file writes on a thread pool with a bounded number in flight.
+    
+    Once `limit` writes are pending, submit() waits for the oldest one, so
+    rendered content never piles up in memory faster than the disk takes
+    it. Finished writes are dropped as they complete. Write errors are
+    re-raised from submit() or when the context exits.
+    """
+    
+    def __init__(self, limit: int = WRITE_WORKERS * WRITE_QUEUE_DEPTH):
+        """
+        Initialize the writer.
+        
+        Args:
+            limit: Maximum writes queued or running at once
+        """
+        self._pool = ThreadPoolExecutor(max_workers=WRITE_WORKERS)
+        self._pending: Deque[Future] = deque()
+        self._limit = limit
+    
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        """Queue fn(*args, **kwargs), first waiting for room if needed."""
+        pending = self._pending
+        while pending and (pending[0].done() or len(pending) >= self._limit):
+            pending.popleft().result()
+        pending.append(self._pool.submit(fn, *args, **kwargs))
+    
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+    
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            # Surface any write errors
+            if exc_type is None:
+                while self._pending:
+                    self._pending.popleft().result()
+        finally:
+            self._pool.shutdown(wait=True)
+
 
 class BaseExporter(ABC):
     """
     Abstract base class for conversation exporters.
     
     Exporters are responsible for converting UniversalChat objects
-    into various output formats.
+    into various output formats. Output is written incrementally through
+    a sink, so callers can stream chats to disk as they are produced:
+        
+        with exporter.open_sink(output_path) as sink:
+            for chat in chats:
+                exporter.write_incremental(chat, sink)
     """
     
-    @abstractmethod
-    def export(self, chats: List[UniversalChat], output_path: Path) -> None:
+    def export(self, chats: Iterable[UniversalChat], output_path: Path) -> None:
         """
         Export conversations to the specified path.
         
         Args:
-            chats: List of conversations to export
+            chats: Conversations to export
+            output_path: Path to write output (file or directory)
+        """
+        with self.open_sink(output_path) as sink:
+            for chat in chats:
+                self.write_incremental(chat, sink)
+    
+    @abstractmethod
+    def open_sink(self, output_path: Path) -> AbstractContextManager[Any]:
+        """
+        Open the output for incremental export.
+        
+        The returned context manager yields an exporter-specific sink and
+        finalizes the output (closing brackets, flushing files) on exit.
+        
+        Args:
             output_path: Path to write output (file or directory)
+            
+        Returns:
+            Context manager yielding the sink
+        """
+        pass
+    
+    @abstractmethod
+    def write_incremental(self, chat: UniversalChat, sink: Any) -> None:
+        """
+        Write one conversation to an open sink.
+        
+        Args:
+            chat: Conversation to export
+            sink: Sink yielded by open_sink
         """
         pass
     
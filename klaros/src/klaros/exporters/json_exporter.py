@@ -1,12 +1,32 @@
 """JSON exporter for universal format."""
 
-import json
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Any
+from typing import IO, Any, Iterator, Optional
 
 from klaros.models import UniversalChat
-from klaros.exporters.base import BaseExporter
+from klaros.exporters.base import BaseExporter, BackgroundWriter, dumps_json, open_atomic
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """ISO-8601 string for a datetime, or None."""
+    return value.isoformat() if value else None
+
+
+@dataclass
+class _ArraySink:
+    """Open single-file JSON export: the file and items written so far."""
+    file: IO[bytes]
+    count: int = 0
+
+
+@dataclass
+class _DirectorySink:
+    """Open per-chat JSON export: target directory and in-flight writes."""
+    output_path: Path
+    writer: BackgroundWriter
 
 
 class JSONExporter(BaseExporter):
@@ -34,50 +54,88 @@ class JSONExporter(BaseExporter):
         self.pretty = pretty
         self.single_file = single_file
     
-    def export(self, chats: List[UniversalChat], output_path: Path) -> None:
+    def open_sink(self, output_path: Path) -> AbstractContextManager[Any]:
         """
-        Export conversations to JSON.
+        Open JSON output for incremental export.
         
         Args:
-            chats: List of conversations to export
             output_path: Path to write output
         """
         if self.single_file:
-            self._export_single_file(chats, output_path)
+            return self._open_single_file(output_path)
+        return self._open_multiple_files(output_path)
+    
+    def write_incremental(self, chat: UniversalChat, sink: Any) -> None:
+        """
+        Write one conversation to an open sink.
+        
+        Args:
+            chat: Conversation to export
+            sink: Sink yielded by open_sink
+        """
+        if self.single_file:
+            self._write_array_item(chat, sink)
         else:
-            self._export_multiple_files(chats, output_path)
+            self._write_chat_file(chat, sink)
     
-    def _export_single_file(self, chats: List[UniversalChat], output_path: Path) -> None:
-        """Export all chats to a single JSON file."""
+    @contextmanager
+    def _open_single_file(self, output_path: Path) -> Iterator[_ArraySink]:
+        """
+        Stream all chats into a single JSON array file.
+        
+        The file only replaces output_path once the export completes.
+        """
         # Ensure .json extension
         if output_path.suffix.lower() != '.json':
             output_path = output_path.with_suffix('.json')
         
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
-        data = [self._chat_to_dict(chat) for chat in chats]
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if self.pretty:
-                json.dump(data, f, indent=2, default=self._json_serializer)
-            else:
-                json.dump(data, f, default=self._json_serializer)
+        with open_atomic(output_path) as f:
+            sink = _ArraySink(file=f)
+            f.write(b'[')
+            yield sink
+            # Match a whole-array dump: "[]" when empty, closing bracket on
+            # its own line when pretty printed
+            if sink.count and self.pretty:
+                f.write(b'\n')
+            f.write(b']')
+    
+    def _write_array_item(self, chat: UniversalChat, sink: _ArraySink) -> None:
+        """Append one chat to the open JSON array."""
+        item = self._dumps(self._chat_to_dict(chat))
+        if self.pretty:
+            # Items sit one level deep; JSON strings never contain raw
+            # newlines, so re-indenting line starts is safe
+            sink.file.write(b',\n  ' if sink.count else b'\n  ')
+            sink.file.write(item.replace(b'\n', b'\n  '))
+        else:
+            if sink.count:
+                sink.file.write(b',')
+            sink.file.write(item)
+        sink.count += 1
     
-    def _export_multiple_files(self, chats: List[UniversalChat], output_path: Path) -> None:
-        """Export each chat to a separate JSON file."""
+    @contextmanager
+    def _open_multiple_files(self, output_path: Path) -> Iterator[_DirectorySink]:
+        """
+        Export each chat to a separate JSON file in output_path.
+        
+        Files are written by a thread pool with a bounded number of writes
+        in flight; leaving the context waits for pending writes and
+        re-raises the first write error.
+        """
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for chat in chats:
-            file_name = f"{chat.id}.json"
-            file_path = output_path / file_name
-            
-            data = self._chat_to_dict(chat)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if self.pretty:
-                    json.dump(data, f, indent=2, default=self._json_serializer)
-                else:
-                    json.dump(data, f, default=self._json_serializer)
+        with BackgroundWriter() as writer:
+            yield _DirectorySink(output_path=output_path, writer=writer)
+    
+    def _write_chat_file(self, chat: UniversalChat, sink: _DirectorySink) -> None:
+        """Serialize one chat and queue the write of its own JSON file."""
+        file_name = f"{chat.id}.json"
+        file_path = sink.output_path / file_name
+        
+        payload = self._dumps(self._chat_to_dict(chat))
+        sink.writer.submit(file_path.write_bytes, payload)
     
     def export_single(self, chat: UniversalChat) -> str:
         """
@@ -89,12 +147,11 @@ class JSONExporter(BaseExporter):
         Returns:
             JSON formatted string
         """
-        data = self._chat_to_dict(chat)
-        
-        if self.pretty:
-            return json.dumps(data, indent=2, default=self._json_serializer)
-        else:
-            return json.dumps(data, default=self._json_serializer)
+        return self._dumps(self._chat_to_dict(chat)).decode('utf-8')
+    
+    def _dumps(self, data: Any) -> bytes:
+        """Serialize data as configured (pretty or compact)."""
+        return dumps_json(data, pretty=self.pretty, default=self._json_serializer)
     
     def _chat_to_dict(self, chat: UniversalChat) -> dict[str, Any]:
         """Convert UniversalChat to serializable dict."""
@@ -103,14 +160,14 @@ class JSONExporter(BaseExporter):
             "source": chat.source,
             "source_file": chat.source_file,
             "title": chat.title,
-            "created_at": chat.created_at.isoformat() if chat.created_at else None,
-            "updated_at": chat.updated_at.isoformat() if chat.updated_at else None,
+            "created_at": _isoformat(chat.created_at),
+            "updated_at": _isoformat(chat.updated_at),
             "messages": [
                 {
                     "id": msg.id,
-                    "role": msg.role,
+                    "role": str(msg.role),
                     "text": msg.text,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
+                    "timestamp": _isoformat(msg.timestamp_dt),
                     "metadata": msg.metadata
                 }
                 for msg in chat.messages
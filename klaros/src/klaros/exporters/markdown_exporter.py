@@ -1,12 +1,44 @@
 """Markdown exporter for Obsidian/Notion compatibility."""
 
+import io
+import os
 import re
-from datetime import datetime
+import unicodedata
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, Set
 
-from klaros.models import UniversalChat
-from klaros.exporters.base import BaseExporter
+from klaros.models import UniversalChat, MessageRole
+from klaros.exporters.base import BaseExporter, BackgroundWriter
+
+
+# Filename sanitization patterns
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+WHITESPACE_RUN = re.compile(r'\s+')
+
+
+def _name_key(name: str) -> str:
+    """
+    Form of a file name used for collision checks.
+    
+    Case-insensitive filesystems (APFS, NTFS) treat names differing only
+    by case or Unicode normalization as the same file, so those count as
+    taken too.
+    """
+    return unicodedata.normalize('NFC', name).casefold()
+
+
+@dataclass
+class _MarkdownSink:
+    """Open Markdown export: target directory and in-flight writes."""
+    output_path: Path
+    writer: BackgroundWriter
+    # File names taken per directory, as _name_key forms: snapshotted with
+    # one scandir the first time a directory is used, then extended with
+    # every name handed out. Writes complete asynchronously, so the
+    # filesystem alone cannot tell us a name is already taken.
+    taken: Dict[Path, Set[str]] = field(default_factory=dict)
 
 
 class MarkdownExporter(BaseExporter):
@@ -38,33 +70,46 @@ class MarkdownExporter(BaseExporter):
         self.organize_by_date = organize_by_date
         self.include_timestamps = include_timestamps
     
-    def export(self, chats: List[UniversalChat], output_path: Path) -> None:
+    @contextmanager
+    def open_sink(self, output_path: Path) -> Iterator[_MarkdownSink]:
         """
-        Export conversations to Markdown files.
+        Open a Markdown output directory for incremental export.
+        
+        Files are written by a thread pool with a bounded number of writes
+        in flight; leaving the context waits for pending writes and
+        re-raises the first write error.
         
         Args:
-            chats: List of conversations to export
             output_path: Directory to write files to
         """
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for chat in chats:
-            # Determine file path
-            file_name = self._sanitize_filename(chat.title) + ".md"
-            
-            if self.organize_by_date and chat.created_at:
-                date_folder = chat.created_at.strftime("%Y/%m")
-                file_path = output_path / date_folder / file_name
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-            else:
-                file_path = output_path / file_name
-            
-            # Handle duplicate filenames
-            file_path = self._unique_path(file_path)
-            
-            # Write content
-            content = self.export_single(chat)
-            file_path.write_text(content, encoding='utf-8')
+        with BackgroundWriter() as writer:
+            yield _MarkdownSink(output_path=output_path, writer=writer)
+    
+    def write_incremental(self, chat: UniversalChat, sink: _MarkdownSink) -> None:
+        """
+        Render one conversation and queue its file write.
+        
+        Args:
+            chat: Conversation to export
+            sink: Sink yielded by open_sink
+        """
+        # Determine file path
+        file_name = self._sanitize_filename(chat.title) + ".md"
+        
+        if self.organize_by_date and chat.created_at:
+            directory = sink.output_path / chat.created_at.strftime("%Y/%m")
+        else:
+            directory = sink.output_path
+        
+        # Handle duplicate filenames
+        file_name = self._unique_name(file_name, self._taken_names(sink, directory))
+        file_path = directory / file_name
+        
+        # Render here, write in the background
+        content = self.export_single(chat)
+        sink.writer.submit(file_path.write_text, content, encoding='utf-8')
     
     def export_single(self, chat: UniversalChat) -> str:
         """
@@ -76,70 +121,78 @@ class MarkdownExporter(BaseExporter):
         Returns:
             Markdown formatted string
         """
-        parts = []
+        buf = io.StringIO()
+        write = buf.write
         
         # YAML Frontmatter
         if self.include_frontmatter:
-            parts.append(self._build_frontmatter(chat))
+            self._write_frontmatter(buf, chat)
+            write("\n")
         
         # Title
-        parts.append(f"# {chat.title}\n")
+        write("# ")
+        write(chat.title)
+        write("\n")
         
         # Messages
         for msg in chat.messages:
-            role_header = self._format_role(msg.role)
+            write("\n## ")
+            write(self._format_role(msg.role))
             
             # Add timestamp if enabled
-            if self.include_timestamps and msg.timestamp:
-                timestamp_str = msg.timestamp.strftime("%Y-%m-%d %H:%M")
-                role_header = f"{role_header} ({timestamp_str})"
+            if self.include_timestamps:
+                timestamp = msg.timestamp_dt
+                if timestamp:
+                    write(" (")
+                    write(timestamp.strftime("%Y-%m-%d %H:%M"))
+                    write(")")
             
-            parts.append(f"## {role_header}\n")
-            parts.append(f"{msg.text}\n")
+            write("\n\n")
+            write(msg.text)
+            write("\n")
         
-        return "\n".join(parts)
+        return buf.getvalue()
     
-    def _build_frontmatter(self, chat: UniversalChat) -> str:
-        """Build YAML frontmatter block."""
-        lines = ["---"]
+    def _write_frontmatter(self, buf: io.StringIO, chat: UniversalChat) -> None:
+        """Write YAML frontmatter block into buf."""
+        write = buf.write
+        write("---\n")
         
         # Title
         safe_title = chat.title.replace('"', '\\"')
-        lines.append(f'title: "{safe_title}"')
+        write(f'title: "{safe_title}"\n')
         
         # Date
         if chat.created_at:
-            lines.append(f"date: {chat.created_at.strftime('%Y-%m-%d')}")
+            write(f"date: {chat.created_at.strftime('%Y-%m-%d')}\n")
         
         # Source
-        lines.append(f"source: {chat.source}")
+        write(f"source: {chat.source}\n")
         
         # Tags
         if chat.tags:
             tag_list = ", ".join(chat.tags)
-            lines.append(f"tags: [{tag_list}]")
+            write(f"tags: [{tag_list}]\n")
         
         # Message count
-        lines.append(f"messages: {len(chat.messages)}")
+        write(f"messages: {len(chat.messages)}\n")
         
-        lines.append("---\n")
-        
-        return "\n".join(lines)
+        write("---\n")
     
-    def _format_role(self, role: str) -> str:
+    def _format_role(self, role: MessageRole) -> str:
         """Format role for display."""
         role_map = {
-            "user": "👤 User",
-            "assistant": "🤖 Assistant",
-            "system": "⚙️ System"
+            MessageRole.USER: "👤 User",
+            MessageRole.ASSISTANT: "🤖 Assistant",
+            MessageRole.SYSTEM: "⚙️ System"
         }
-        return role_map.get(role, role.title())
+        return role_map.get(role, str(role).title())
     
     def _sanitize_filename(self, title: str) -> str:
         """Sanitize title for use as filename."""
         # Remove/replace invalid characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        sanitized = INVALID_FILENAME_CHARS.sub('', title)
+        sanitized = WHITESPACE_RUN.sub(' ', sanitized).strip()
         
         # Limit length
         if len(sanitized) > 100:
@@ -151,17 +204,33 @@ class MarkdownExporter(BaseExporter):
         
         return sanitized
     
-    def _unique_path(self, path: Path) -> Path:
-        """Ensure path is unique by adding suffix if needed."""
-        if not path.exists():
-            return path
-        
-        counter = 1
-        stem = path.stem
-        suffix = path.suffix
-        
-        while path.exists():
-            path = path.with_name(f"{stem}_{counter}{suffix}")
-            counter += 1
+    def _taken_names(self, sink: _MarkdownSink, directory: Path) -> Set[str]:
+        """
+        Names already used in a directory, creating and scanning it once.
         
-        return path
+        Args:
+            sink: Sink yielded by open_sink
+            directory: Directory the next file goes into
+            
+        Returns:
+            Mutable set of taken file names for the directory, as _name_key forms
+        """
+        taken = sink.taken.get(directory)
+        if taken is None:
+            directory.mkdir(parents=True, exist_ok=True)
+            with os.scandir(directory) as entries:
+                taken = {_name_key(entry.name) for entry in entries}
+            sink.taken[directory] = taken
+        return taken
+    
+    def _unique_name(self, name: str, taken: Set[str]) -> str:
+        """Ensure name is unique in taken by adding suffix if needed, and claim it."""
+        if _name_key(name) in taken:
+            stem, dot, suffix = name.rpartition('.')
+            counter = 1
+            while _name_key(f"{stem}_{counter}{dot}{suffix}") in taken:
+                counter += 1
+            name = f"{stem}_{counter}{dot}{suffix}"
+        
+        taken.add(_name_key(name))
+        return name
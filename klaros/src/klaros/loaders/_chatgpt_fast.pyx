@@ -0,0 +1,88 @@
+# cython: language_level=3str, boundscheck=False, wraparound=False
+"""
+Compiled fast path for ChatGPT mapping traversal.
+
+Mirrors ChatGPTLoader._walk_records and ChatGPTLoader._extract_message and
+returns the same (id, role, text, create_time, model) records, which the
+loader wraps into Message objects. The extension is optional: when it is
+not built the loader uses the pure-Python walk.
+"""
+
+
+cdef tuple TEXT_CONTENT_TYPES = ('text', 'user_editable_context')
+
+
+cdef object _extract(object msg_data, dict roles):
+    """Extract one message record, or None if it should be skipped."""
+    cdef dict msg, author, content, metadata
+    cdef list text_parts = []
+    cdef object role, parts, part
+    cdef str text
+
+    try:
+        msg = msg_data
+        author = msg.get('author', {})
+        role = roles.get(author.get('role', ''))
+        if role is None:
+            return None
+
+        content = msg.get('content', {})
+        if content.get('content_type', '') not in TEXT_CONTENT_TYPES:
+            return None
+
+        parts = content.get('parts', [])
+        for part in parts:
+            if isinstance(part, str):
+                text_parts.append(part)
+            elif isinstance(part, dict) and part.get('text'):
+                text_parts.append(part['text'])
+
+        text = '\n'.join(text_parts).strip()
+        if not text:
+            return None
+
+        metadata = msg.get('metadata', {})
+        if metadata.get('is_visually_hidden_from_conversation'):
+            return None
+
+        return (
+            msg.get('id'),
+            role,
+            text,
+            msg.get('create_time'),
+            metadata.get('model_slug'),
+        )
+    except Exception:
+        return None
+
+
+cpdef list traverse(dict mapping, dict root, dict roles):
+    """
+    Follow the first child from root and collect message records.
+
+    Args:
+        mapping: The conversation's node mapping
+        root: Root node to start from
+        roles: Role string to MessageRole map; other roles are skipped
+
+    Returns:
+        List of (id, role, text, create_time, model) tuples
+    """
+    cdef list out = []
+    cdef dict node = root
+    cdef object msg_data, record, children
+    cdef Py_ssize_t remaining = len(mapping)
+
+    while node and remaining:
+        remaining -= 1
+        msg_data = node.get('message')
+
+        if msg_data:
+            record = _extract(msg_data, roles)
+            if record is not None:
+                out.append(record)
+
+        children = node.get('children')
+        node = mapping.get(children[0]) if children else None
+
+    return out
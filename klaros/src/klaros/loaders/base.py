@@ -2,11 +2,24 @@
 
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Generator
+from typing import Any, Generator
+
+import ijson
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from klaros.models import UniversalChat
 
 
+# Exports up to this size are decoded in one shot with orjson, which is
+# several times faster than incremental parsing. Larger files are streamed.
+STREAMING_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+
 class BaseLoader(ABC):
     """
     Abstract base class for AI platform export loaders.
@@ -46,6 +59,43 @@ class BaseLoader(ABC):
         """
         pass
     
+    @abstractmethod
+    def parse_conversation(self, conv: dict[str, Any], source_file: str) -> UniversalChat | None:
+        """
+        Normalize one raw conversation dict from iter_raw.
+        
+        Kept separate from load() so callers can fan raw conversations
+        out to worker processes.
+        
+        Args:
+            conv: Raw conversation dict as found in the export
+            source_file: Path of the export, recorded on the chat
+            
+        Returns:
+            UniversalChat, or None if the conversation could not be parsed
+        """
+        pass
+    
+    def iter_raw(self, file_path: Path) -> Generator[dict[str, Any], None, None]:
+        """
+        Iterate raw conversation dicts from a top-level JSON array.
+        
+        Small files are decoded with orjson when it is installed. Anything
+        above STREAMING_THRESHOLD_BYTES is parsed incrementally with ijson,
+        so memory is bounded by a single conversation.
+        
+        Args:
+            file_path: Path to the export file
+            
+        Yields:
+            Raw conversation dicts in file order
+        """
+        with open(file_path, 'rb') as f:
+            if HAS_ORJSON and file_path.stat().st_size <= STREAMING_THRESHOLD_BYTES:
+                yield from orjson.loads(f.read())
+            else:
+                yield from ijson.items(f, 'item', use_float=True)
+    
     def validate(self, file_path: Path) -> bool:
         """
         Validate that a file can be parsed by this loader.
@@ -1,13 +1,27 @@
 """Loader for ChatGPT (OpenAI) conversation exports."""
 
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, Any
+import uuid
 
 from klaros.models import UniversalChat, Message, MessageRole, SourcePlatform
 from klaros.loaders.base import BaseLoader
 
+try:
+    from klaros.loaders._chatgpt_fast import traverse as fast_traverse
+except ImportError:
+    fast_traverse = None
+
+
+# ChatGPT author roles we keep; anything else (e.g. tool) is skipped
+ROLE_MAP = {
+    'user': MessageRole.USER,
+    'assistant': MessageRole.ASSISTANT,
+    'system': MessageRole.SYSTEM,
+}
+
 
 class ChatGPTLoader(BaseLoader):
     """
@@ -48,32 +62,27 @@ class ChatGPTLoader(BaseLoader):
         Yields:
             UniversalChat for each conversation
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        for conv in data:
-            chat = self._parse_conversation(conv, str(file_path))
+        for conv in self.iter_raw(file_path):
+            chat = self.parse_conversation(conv, str(file_path))
             if chat and chat.messages:  # Skip empty conversations
                 yield chat
     
     def count_conversations(self, file_path: Path) -> int:
         """Count conversations in file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return len(data)
+        return sum(1 for _ in self.iter_raw(file_path))
     
-    def _parse_conversation(self, conv: dict[str, Any], source_file: str) -> UniversalChat | None:
+    def parse_conversation(self, conv: dict[str, Any], source_file: str) -> UniversalChat | None:
         """Parse a single conversation dict into UniversalChat."""
         try:
             mapping = conv.get('mapping', {})
             
             # Find the root node (no parent)
-            root_id = self._find_root(mapping)
-            if not root_id:
+            root = self._find_root(mapping)
+            if root is None:
                 return None
             
             # Traverse the tree to extract messages
-            messages = self._traverse_tree(mapping, root_id)
+            messages = self._traverse_tree(mapping, root)
             
             # Parse timestamps (ChatGPT uses Unix timestamps)
             created_at = None
@@ -105,61 +114,83 @@ class ChatGPTLoader(BaseLoader):
             print(f"Warning: Failed to parse conversation {conv.get('title', 'unknown')}: {e}")
             return None
     
-    def _find_root(self, mapping: dict[str, Any]) -> str | None:
-        """Find the root node ID (node with no parent)."""
-        for node_id, node in mapping.items():
+    def _find_root(self, mapping: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Find the root node (node with no parent).
+        
+        Returns the node itself rather than its ID so the traversal can
+        start from it without a second lookup. The scan exits on the first
+        match, which in real exports is almost always the first entry.
+        """
+        for node in mapping.values():
             if node.get('parent') is None:
-                return node_id
+                return node
         return None
     
-    def _traverse_tree(self, mapping: dict[str, Any], node_id: str) -> list[Message]:
+    def _traverse_tree(self, mapping: dict[str, Any], root: dict[str, Any]) -> list[Message]:
         """
-        Recursively traverse the message tree to reconstruct linear conversation.
+        Walk the message tree to reconstruct linear conversation.
         
         Follows the first child at each level (main thread).
         This handles ChatGPT's branching conversation structure.
+        Uses the compiled _chatgpt_fast extension when it is built and
+        the pure-Python walk otherwise; both produce identical records.
         
         Args:
             mapping: The mapping dict containing all nodes
-            node_id: Current node ID to process
+            root: Root node to start from
             
         Returns:
             List of Message objects in chronological order
         """
-        node = mapping.get(node_id)
-        if not node:
-            return []
+        if fast_traverse is not None:
+            records = fast_traverse(mapping, root, ROLE_MAP)
+        else:
+            records = self._walk_records(mapping, root)
         
-        messages = []
-        msg_data = node.get('message')
+        return [self._build_message(*record) for record in records]
+    
+    def _walk_records(self, mapping: dict[str, Any], root: dict[str, Any]) -> list[tuple]:
+        """
+        Pure-Python tree walk yielding raw message records.
         
-        if msg_data:
-            message = self._parse_message(msg_data)
-            if message:
-                messages.append(message)
+        The walk is iterative, so very long conversations cannot hit
+        the recursion limit. Keep in sync with _chatgpt_fast.traverse.
+        """
+        records = []
+        node = root
+        # A well-formed thread visits each node at most once; the bound
+        # stops a malformed cyclic mapping from looping forever.
+        remaining = len(mapping)
         
-        # Follow children (take first child for main thread)
-        children = node.get('children', [])
-        if children:
+        while node and remaining:
+            remaining -= 1
+            msg_data = node.get('message')
+            
+            if msg_data:
+                record = self._extract_message(msg_data)
+                if record:
+                    records.append(record)
+            
             # Follow the first child (main conversation thread)
-            messages.extend(self._traverse_tree(mapping, children[0]))
+            children = node.get('children')
+            node = mapping.get(children[0]) if children else None
         
-        return messages
+        return records
     
-    def _parse_message(self, msg_data: dict[str, Any]) -> Message | None:
-        """Parse a single message from the mapping structure."""
+    def _extract_message(self, msg_data: dict[str, Any]) -> tuple | None:
+        """
+        Extract (id, role, text, create_time, model) from a mapping message.
+        
+        Returns None for messages that should be skipped.
+        """
         try:
             author = msg_data.get('author', {})
             role_str = author.get('role', '')
             
             # Map role string to MessageRole enum
-            if role_str == 'user':
-                role = MessageRole.USER
-            elif role_str == 'assistant':
-                role = MessageRole.ASSISTANT
-            elif role_str == 'system':
-                role = MessageRole.SYSTEM
-            else:
+            role = ROLE_MAP.get(role_str)
+            if role is None:
                 return None  # Skip unknown roles
             
             # Extract text content
@@ -190,23 +221,43 @@ class ChatGPTLoader(BaseLoader):
             if metadata.get('is_visually_hidden_from_conversation'):
                 return None
             
-            # Parse timestamp
-            timestamp = None
-            create_time = msg_data.get('create_time')
-            if create_time:
-                try:
-                    timestamp = datetime.fromtimestamp(create_time)
-                except (ValueError, TypeError, OSError):
-                    pass
-            
-            return Message(
-                id=msg_data.get('id', ''),
-                role=role,
-                text=text,
-                timestamp=timestamp,
-                metadata={
-                    'model': metadata.get('model_slug'),
-                } if metadata.get('model_slug') else None
+            return (
+                msg_data.get('id'),
+                role,
+                text,
+                msg_data.get('create_time'),
+                metadata.get('model_slug'),
             )
         except Exception:
             return None
+    
+    def _build_message(
+        self,
+        msg_id: str | None,
+        role: MessageRole,
+        text: str,
+        create_time: Any,
+        model: str | None
+    ) -> Message:
+        """Build a Message from an extracted record."""
+        # Keep the raw epoch; exporters convert only if they print it
+        timestamp = None
+        if create_time:
+            try:
+                timestamp = float(create_time)
+            except (ValueError, TypeError):
+                pass
+        
+        # Few distinct model slugs appear across an export; intern them so
+        # every message shares one string object per slug
+        metadata = None
+        if model:
+            metadata = {'model': sys.intern(model) if isinstance(model, str) else model}
+        
+        return Message(
+            id=msg_id or str(uuid.uuid4()),
+            role=role,
+            text=text,
+            timestamp=timestamp,
+            metadata=metadata
+        )
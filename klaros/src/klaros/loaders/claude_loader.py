@@ -1,6 +1,6 @@
 """Loader for Claude (Anthropic) conversation exports."""
 
-import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Generator, Any
@@ -9,6 +9,21 @@ from klaros.models import UniversalChat, Message, MessageRole, SourcePlatform
 from klaros.loaders.base import BaseLoader
 
 
+# Python 3.11+ parses a trailing 'Z' natively, so skip the copying replace()
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat
+else:
+    def _parse_iso(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# Claude sender values; unknown senders are treated as system messages
+SENDER_ROLE_MAP = {
+    'human': MessageRole.USER,
+    'assistant': MessageRole.ASSISTANT,
+}
+
+
 class ClaudeLoader(BaseLoader):
     """
     Parser for Claude conversation exports.
@@ -46,21 +61,16 @@ class ClaudeLoader(BaseLoader):
         Yields:
             UniversalChat for each conversation
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        for conv in data:
-            chat = self._parse_conversation(conv, str(file_path))
+        for conv in self.iter_raw(file_path):
+            chat = self.parse_conversation(conv, str(file_path))
             if chat and chat.messages:  # Skip empty conversations
                 yield chat
     
     def count_conversations(self, file_path: Path) -> int:
         """Count conversations in file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return len(data)
+        return sum(1 for _ in self.iter_raw(file_path))
     
-    def _parse_conversation(self, conv: dict[str, Any], source_file: str) -> UniversalChat | None:
+    def parse_conversation(self, conv: dict[str, Any], source_file: str) -> UniversalChat | None:
         """Parse a single conversation dict into UniversalChat."""
         try:
             messages = self._parse_messages(conv.get('chat_messages', []))
@@ -71,17 +81,13 @@ class ClaudeLoader(BaseLoader):
             
             if conv.get('created_at'):
                 try:
-                    created_at = datetime.fromisoformat(
-                        conv['created_at'].replace('Z', '+00:00')
-                    )
+                    created_at = _parse_iso(conv['created_at'])
                 except (ValueError, TypeError):
                     pass
             
             if conv.get('updated_at'):
                 try:
-                    updated_at = datetime.fromisoformat(
-                        conv['updated_at'].replace('Z', '+00:00')
-                    )
+                    updated_at = _parse_iso(conv['updated_at'])
                 except (ValueError, TypeError):
                     pass
             
@@ -120,22 +126,18 @@ class ClaudeLoader(BaseLoader):
                 continue
             
             # Map sender to role
-            sender = msg.get('sender', '')
-            if sender == 'human':
-                role = MessageRole.USER
-            elif sender == 'assistant':
-                role = MessageRole.ASSISTANT
-            else:
-                role = MessageRole.SYSTEM
+            role = SENDER_ROLE_MAP.get(msg.get('sender', ''), MessageRole.SYSTEM)
             
-            # Parse timestamp
+            # Parse timestamp, keeping its offset so exports show the
+            # same wall time and offset as the source
             timestamp = None
+            tz = None
             if msg.get('created_at'):
                 try:
-                    timestamp = datetime.fromisoformat(
-                        msg['created_at'].replace('Z', '+00:00')
-                    )
-                except (ValueError, TypeError):
+                    created = _parse_iso(msg['created_at'])
+                    timestamp = created.timestamp()
+                    tz = created.tzinfo
+                except (ValueError, TypeError, OverflowError, OSError):
                     pass
             
             messages.append(Message(
@@ -143,6 +145,7 @@ class ClaudeLoader(BaseLoader):
                 role=role,
                 text=text.strip(),
                 timestamp=timestamp,
+                tz=tz,
                 metadata={}
             ))
         
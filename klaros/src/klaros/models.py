@@ -1,45 +1,80 @@
 """
-Pydantic models for the Universal Memory Schema.
+Dataclass models for the Universal Memory Schema.
 
 All AI conversation exports are normalized into these models
-before processing or export.
+before processing or export. They are plain slotted dataclasses:
+loaders build them from already-checked data, so no validation
+runs on construction.
 """
 
-from datetime import datetime
-from enum import Enum
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from enum import Enum, IntEnum
 from typing import List, Optional, Any
-from pydantic import BaseModel, Field
 import uuid
 
 
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
 class SourcePlatform(str, Enum):
     """Supported AI platforms for import."""
     CHATGPT = "chatgpt"
     CLAUDE = "claude"
     GEMINI = "gemini"
+    
+    def __str__(self) -> str:
+        return self.value
 
 
-class MessageRole(str, Enum):
-    """Role of the message sender."""
-    USER = "user"
-    ASSISTANT = "assistant"
-    SYSTEM = "system"
+class MessageRole(IntEnum):
+    """
+    Role of the message sender.
+    
+    An IntEnum so role checks are plain integer comparisons. Serialized
+    output uses the lowercase name ("user", "assistant", "system").
+    """
+    USER = 0
+    ASSISTANT = 1
+    SYSTEM = 2
+    
+    def __str__(self) -> str:
+        return self.name.lower()
 
 
-class Message(BaseModel):
-    """A single message in a conversation."""
+@dataclass(slots=True, kw_only=True)
+class Message:
+    """
+    A single message in a conversation.
+    
+    The id defaults to empty rather than a fresh UUID: loaders pass the
+    platform's own message id and only generate one when it is missing.
+    The timestamp is kept as Unix epoch seconds; use timestamp_dt when a
+    datetime is actually needed. tz is the UTC offset the source gave the
+    timestamp in, or None for naive local time.
+    """
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = ""
     role: MessageRole
     text: str
-    timestamp: Optional[datetime] = None
+    timestamp: Optional[float] = None
+    tz: Optional[tzinfo] = None
     metadata: Optional[dict[str, Any]] = None
     
-    class Config:
-        use_enum_values = True
+    @property
+    def timestamp_dt(self) -> Optional[datetime]:
+        """Message timestamp as a datetime in tz (local if none), converted on demand."""
+        if self.timestamp is None:
+            return None
+        try:
+            return datetime.fromtimestamp(self.timestamp, self.tz)
+        except (ValueError, OverflowError, OSError):
+            return None
 
 
-class UniversalChat(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class UniversalChat:
     """
     Universal Memory Unit - The canonical representation of a conversation.
     
@@ -47,23 +82,20 @@ class UniversalChat(BaseModel):
     before processing or export.
     """
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_id)
     source: SourcePlatform
     source_file: str = ""
     title: str
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    messages: List[Message] = Field(default_factory=list)
-    tags: List[str] = Field(default_factory=list)
+    messages: List[Message] = field(default_factory=list)
+    tags: List[str] = field(default_factory=list)
     token_count: Optional[int] = None
     
     # Derived metadata (populated by processors)
     sentiment: Optional[str] = None
     summary: Optional[str] = None
     
-    class Config:
-        use_enum_values = True
-    
     @property
     def message_count(self) -> int:
         """Total number of messages in the conversation."""
@@ -84,7 +116,8 @@ class UniversalChat(BaseModel):
         return "\n\n".join(m.text for m in self.messages if m.text)
 
 
-class ConversionStats(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class ConversionStats:
     """Statistics from a conversion operation."""
     
     total_conversations: int = 0
@@ -3,9 +3,11 @@
 from klaros.processors.cleaner import CleanerService
 from klaros.processors.privacy import PrivacyService
 from klaros.processors.tagger import TaggerService
+from klaros.processors.pipeline import FusedProcessor
 
 __all__ = [
     'CleanerService',
     'PrivacyService',
     'TaggerService',
+    'FusedProcessor',
 ]
@@ -5,9 +5,11 @@ This processor is designed to work locally without any LLM API calls.
 """
 
 import re
-from typing import List
+from dataclasses import replace
+from typing import List, Optional
 
-from klaros.models import UniversalChat, Message
+from klaros.models import UniversalChat, Message, MessageRole
+from klaros.processors import parallel
 
 
 # Common AI boilerplate phrases to remove or flag
@@ -21,15 +23,41 @@ BOILERPLATE_PATTERNS = [
     r"^As a language model,?\s*I.*$",
 ]
 
+# All boilerplate patterns as one multiline regex that deletes matching
+# lines (and their newline) in a single sub. Each pattern is matched after
+# the line's leading whitespace, and \s inside a pattern may not cross into
+# the next line, exactly as when matching stripped lines one at a time.
+BOILERPLATE_REGEX = re.compile(
+    r'^[^\S\n]*(?:'
+    + '|'.join(p[1:-1].replace(r'\s', r'[^\S\n]') for p in BOILERPLATE_PATTERNS)
+    + r')\n?',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Lowercase substrings, at least one of which appears in any line matching
+# BOILERPLATE_PATTERNS; text with none of them skips the boilerplate pass.
+# They avoid 'i' and 's', whose case-insensitive matches include characters
+# that lower() does not map to them (U+0130, U+0131, U+017F). Keep in sync
+# with BOILERPLATE_PATTERNS.
+BOILERPLATE_MARKERS = ("language model", "an a", "don't have the ab", "'m unable to")
+
 # HTML/XML tag patterns
 HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
 
-# Excessive whitespace patterns
-WHITESPACE_PATTERNS = [
-    (re.compile(r'\n{3,}'), '\n\n'),  # Multiple newlines -> double newline
-    (re.compile(r' {2,}'), ' '),       # Multiple spaces -> single space
-    (re.compile(r'\t+'), ' '),         # Tabs -> space
-]
+# Excessive whitespace, normalized in a single pass. The alternatives
+# match disjoint characters, so one scan gives the same result as
+# applying them one after another.
+WHITESPACE_PATTERN = re.compile(r'(?P<newlines>\n{3,})|(?P<spaces> {2,})|(?P<tabs>\t+)')
+WHITESPACE_REPLACEMENTS = {
+    'newlines': '\n\n',  # Multiple newlines -> double newline
+    'spaces': ' ',       # Multiple spaces -> single space
+    'tabs': ' ',         # Tabs -> space
+}
+
+
+def _whitespace_replacement(match: re.Match) -> str:
+    """Replacement for one WHITESPACE_PATTERN match."""
+    return WHITESPACE_REPLACEMENTS[match.lastgroup]
 
 
 class CleanerService:
@@ -64,12 +92,6 @@ class CleanerService:
         self.remove_html = remove_html
         self.remove_system_messages = remove_system_messages
         self.normalize_whitespace = normalize_whitespace
-        
-        # Compile boilerplate patterns
-        self._boilerplate_patterns = [
-            re.compile(p, re.IGNORECASE | re.MULTILINE)
-            for p in BOILERPLATE_PATTERNS
-        ]
     
     def process(self, chat: UniversalChat) -> UniversalChat:
         """
@@ -84,24 +106,15 @@ class CleanerService:
         cleaned_messages = []
         
         for msg in chat.messages:
-            # Skip system messages if configured
-            if self.remove_system_messages and msg.role == "system":
+            cleaned_text = self.clean_message(msg)
+            if cleaned_text is None:
                 continue
             
-            # Clean the text
-            cleaned_text = self._clean_text(msg.text)
-            
-            # Skip empty messages after cleaning
-            if not cleaned_text or not cleaned_text.strip():
-                continue
-            
-            cleaned_messages.append(Message(
-                id=msg.id,
-                role=msg.role,
-                text=cleaned_text,
-                timestamp=msg.timestamp,
-                metadata=msg.metadata
-            ))
+            # Already-clean messages are shared rather than copied; the
+            # regex passes return the input string when nothing matched
+            if cleaned_text != msg.text:
+                msg = replace(msg, text=cleaned_text)
+            cleaned_messages.append(msg)
         
         return UniversalChat(
             id=chat.id,
@@ -115,6 +128,32 @@ class CleanerService:
             token_count=chat.token_count
         )
     
+    def clean_message(self, msg: Message) -> Optional[str]:
+        """
+        Clean one message's text.
+        
+        This is the per-message step of process, also used by
+        FusedProcessor.
+        
+        Args:
+            msg: Message to clean
+            
+        Returns:
+            Cleaned text, or None if the message should be dropped
+        """
+        # Skip system messages if configured
+        if self.remove_system_messages and msg.role == MessageRole.SYSTEM:
+            return None
+        
+        # Clean the text
+        cleaned_text = self._clean_text(msg.text)
+        
+        # Skip empty messages after cleaning
+        if not cleaned_text or not cleaned_text.strip():
+            return None
+        
+        return cleaned_text
+    
     def _clean_text(self, text: str) -> str:
         """Apply all cleaning operations to text."""
         if not text:
@@ -122,30 +161,40 @@ class CleanerService:
         
         result = text
         
+        # Each pass is skipped when a cheap substring check shows it
+        # cannot match, which is the common case for chat text
+        
         # Remove HTML tags
-        if self.remove_html:
+        if self.remove_html and '<' in result:
             result = HTML_TAG_PATTERN.sub('', result)
         
         # Normalize whitespace
-        if self.normalize_whitespace:
-            for pattern, replacement in WHITESPACE_PATTERNS:
-                result = pattern.sub(replacement, result)
+        if self.normalize_whitespace and ('  ' in result or '\t' in result or '\n\n\n' in result):
+            result = WHITESPACE_PATTERN.sub(_whitespace_replacement, result)
         
         # Remove boilerplate (check first line only to preserve content)
-        if self.remove_boilerplate:
-            lines = result.split('\n')
-            filtered_lines = []
-            for line in lines:
-                is_boilerplate = any(
-                    p.match(line.strip()) 
-                    for p in self._boilerplate_patterns
-                )
-                if not is_boilerplate:
-                    filtered_lines.append(line)
-            result = '\n'.join(filtered_lines)
+        if self.remove_boilerplate and self._may_have_boilerplate(result):
+            result = BOILERPLATE_REGEX.sub('', result)
         
         return result.strip()
     
-    def process_batch(self, chats: List[UniversalChat]) -> List[UniversalChat]:
-        """Process multiple conversations."""
-        return [self.process(chat) for chat in chats]
+    def _may_have_boilerplate(self, text: str) -> bool:
+        """Whether text could contain a boilerplate line."""
+        lowered = text.lower()
+        return any(marker in lowered for marker in BOILERPLATE_MARKERS)
+    
+    def process_batch(self, chats: List[UniversalChat], workers: int = 1) -> List[UniversalChat]:
+        """
+        Process multiple conversations.
+        
+        With workers other than 1, large batches are spread over a process
+        pool; see parallel.process_batch for what that requires of callers.
+        
+        Args:
+            chats: Conversations to process
+            workers: Worker processes to use (1 = serial, 0 = CPU count)
+            
+        Returns:
+            Processed conversations, in input order
+        """
+        return parallel.process_batch(self, chats, workers)
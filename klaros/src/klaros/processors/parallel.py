@@ -0,0 +1,62 @@
+"""
+Process-pool helper for batch processing.
+
+Processors are pure functions of a chat, so a batch can be split across
+worker processes without any coordination. Each worker receives the
+processor once, at start-up, and then only the chats it is handed.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional
+
+from klaros.models import UniversalChat
+
+
+# Below this many chats, starting worker processes costs more than it saves
+PARALLEL_MIN_CHATS = 32
+
+# Per-process processor for pool workers, set once by _init_worker
+_worker_processor: Optional[Any] = None
+
+
+def _init_worker(processor: Any) -> None:
+    """Install the processor in a freshly started worker."""
+    global _worker_processor
+    _worker_processor = processor
+
+
+def _process_one(chat: UniversalChat) -> UniversalChat:
+    """Worker entry point: process one conversation."""
+    return _worker_processor.process(chat)
+
+
+def process_batch(processor: Any, chats: List[UniversalChat], workers: int = 1) -> List[UniversalChat]:
+    """
+    Run processor.process over chats, optionally fanning out to a process pool.
+    
+    Batches run in this process by default. Pass workers=0 (CPU count) or
+    a count above 1 to opt in to a pool; small batches still run here.
+    Where worker processes are spawned rather than forked (the default on
+    macOS and Windows), the calling script must then keep its entry point
+    under an `if __name__ == "__main__":` guard.
+    
+    Args:
+        processor: Picklable object with a process(chat) method
+        chats: Conversations to process
+        workers: Worker processes to use (1 = serial, 0 = CPU count)
+        
+    Returns:
+        Processed conversations, in input order
+    """
+    workers = min(workers or os.cpu_count() or 1, len(chats))
+    if workers < 2 or len(chats) < PARALLEL_MIN_CHATS:
+        return [processor.process(chat) for chat in chats]
+    
+    chunksize = max(1, len(chats) // (4 * workers))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(processor,)
+    ) as pool:
+        return list(pool.map(_process_one, chats, chunksize=chunksize))
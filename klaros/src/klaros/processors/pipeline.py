@@ -0,0 +1,89 @@
+"""
+Fused processor - runs cleaning, redaction and tagging in one pass.
+
+The individual services each walk every message and rebuild the chat.
+This processor applies all enabled stages to each message in turn, so
+message text is visited once and only one new chat is built.
+"""
+
+from dataclasses import replace
+from typing import List, Optional
+
+from klaros.models import UniversalChat, Message
+from klaros.processors.cleaner import CleanerService
+from klaros.processors.privacy import PrivacyService
+from klaros.processors.tagger import TaggerService
+
+
+class FusedProcessor:
+    """
+    Single-pass pipeline over the cleaner, privacy and tagger services.
+    
+    Produces the same result as applying the enabled services one after
+    another in that order. Any stage can be left out by passing None.
+    """
+    
+    def __init__(
+        self,
+        cleaner: Optional[CleanerService] = None,
+        privacy: Optional[PrivacyService] = None,
+        tagger: Optional[TaggerService] = None
+    ):
+        """
+        Initialize the pipeline.
+        
+        Args:
+            cleaner: Cleans text and drops empty/system messages
+            privacy: Redacts PII from message text and the title
+            tagger: Extracts tags from the processed text
+        """
+        self.cleaner = cleaner
+        self.privacy = privacy
+        self.tagger = tagger
+    
+    def process(self, chat: UniversalChat) -> UniversalChat:
+        """
+        Run all enabled stages over a conversation.
+        
+        Args:
+            chat: The conversation to process
+            
+        Returns:
+            Processed conversation (new object)
+        """
+        cleaner, privacy, tagger = self.cleaner, self.privacy, self.tagger
+        
+        title = privacy.redact_text(chat.title) if privacy else chat.title
+        
+        messages: List[Message] = []
+        text_parts: List[str] = []
+        
+        if tagger and tagger.use_title and title:
+            text_parts.append(title)
+        
+        for msg in chat.messages:
+            text = msg.text
+            
+            if cleaner:
+                text = cleaner.clean_message(msg)
+                if text is None:
+                    continue
+            
+            if privacy:
+                text = privacy.redact_text(text)
+            
+            # Messages are never mutated, so unchanged ones can be shared
+            if text != msg.text:
+                msg = replace(msg, text=text)
+            messages.append(msg)
+            
+            if tagger and tagger.wants(msg):
+                text_parts.append(text)
+        
+        tags = tagger.extract_tags(text_parts) if tagger else chat.tags
+        
+        return replace(chat, title=title, messages=messages, tags=tags)
+    
+    def process_batch(self, chats: List[UniversalChat]) -> List[UniversalChat]:
+        """Process multiple conversations."""
+        return [self.process(chat) for chat in chats]
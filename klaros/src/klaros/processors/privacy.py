@@ -2,13 +2,23 @@
 Privacy processor - PII redaction using regex patterns.
 
 This processor is designed to work locally without any LLM API calls.
-All pattern matching is done with standard Python regex.
+All pattern matching is done with standard Python regex, or with RE2
+(linear-time, no backtracking) for redacting ASCII text when google-re2
+is installed.
 """
 
 import re
-from typing import List, Optional, Set
+from dataclasses import replace
+from typing import Any, FrozenSet, List, Optional, Set
 
-from klaros.models import UniversalChat, Message
+from klaros.models import UniversalChat
+from klaros.processors import parallel
+
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
 
 
 # PII detection patterns
@@ -30,8 +40,12 @@ PII_PATTERNS = {
         r'3[47][0-9]{13}|'                # Amex
         r'6(?:011|5[0-9]{2})[0-9]{12})\b' # Discover
     ),
+    # Area 001-899 except 666, group 01-99, serial 0001-9999. Spelled out
+    # without lookaheads so RE2 can compile it.
     'ssn': re.compile(
-        r'\b(?!000|666|9\d{2})\d{3}[-\s]?(?!00)\d{2}[-\s]?(?!0000)\d{4}\b'
+        r'\b(?:00[1-9]|0[1-9][0-9]|[1-578][0-9]{2}|6(?:[0-57-9][0-9]|6[0-57-9]))[-\s]?'
+        r'(?:0[1-9]|[1-9][0-9])[-\s]?'
+        r'(?:000[1-9]|00[1-9][0-9]|0[1-9][0-9]{2}|[1-9][0-9]{3})\b'
     ),
     'api_key': re.compile(
         r'\b(?:sk-|pk_|api[_-]?key[=:\s]*)[A-Za-z0-9_-]{20,}\b',
@@ -45,6 +59,9 @@ PII_PATTERNS = {
 # Default replacement format
 DEFAULT_REPLACEMENT = "[REDACTED_{type}]"
 
+# ASCII characters Python's \s matches; RE2's \s leaves out \v and \x1c-\x1f
+ASCII_WHITESPACE = r'\t\n\v\f\r \x1c-\x1f'
+
 
 class PrivacyService:
     """
@@ -75,13 +92,117 @@ class PrivacyService:
             replacement_format: Format string for replacements. 
                                Use {type} for the PII type.
         """
-        self.redact_types = redact_types or set(PII_PATTERNS.keys())
-        self.replacement_format = replacement_format
-        
-        # Validate redact types
-        invalid_types = self.redact_types - set(PII_PATTERNS.keys())
+        self._redact_types = self._validate(redact_types)
+        self._replacement_format = replacement_format
+        self._compile()
+    
+    @property
+    def redact_types(self) -> FrozenSet[str]:
+        """PII types being redacted. Assigning recompiles the patterns."""
+        return self._redact_types
+    
+    @redact_types.setter
+    def redact_types(self, redact_types: Optional[Set[str]]) -> None:
+        self._redact_types = self._validate(redact_types)
+        self._compile()
+    
+    @property
+    def replacement_format(self) -> str:
+        """Format string for replacements. Assigning recompiles the patterns."""
+        return self._replacement_format
+    
+    @replacement_format.setter
+    def replacement_format(self, replacement_format: str) -> None:
+        self._replacement_format = replacement_format
+        self._compile()
+    
+    @staticmethod
+    def _validate(redact_types: Optional[Set[str]]) -> FrozenSet[str]:
+        """Requested PII types, defaulting to all; raises on unknown types."""
+        redact_types = frozenset(redact_types or PII_PATTERNS.keys())
+        invalid_types = redact_types - set(PII_PATTERNS.keys())
         if invalid_types:
-            raise ValueError(f"Unknown PII types: {invalid_types}")
+            raise ValueError(f"Unknown PII types: {set(invalid_types)}")
+        return redact_types
+    
+    def _compile(self) -> None:
+        """Build the patterns used for redaction from the current options."""
+        # Resolve patterns and replacement strings once, in PII_PATTERNS
+        # order so redaction does not depend on set iteration order
+        self._patterns = [
+            (pii_type, pattern, self._replacement_format.format(type=pii_type.upper()))
+            for pii_type, pattern in PII_PATTERNS.items()
+            if pii_type in self._redact_types
+        ]
+        self._replacements = {pii_type: replacement for pii_type, _, replacement in self._patterns}
+        
+        # One alternation with a named group per type, so redaction is a
+        # single scan. Alternatives keep PII_PATTERNS order, which decides
+        # ties at the same offset; per-pattern flags are scoped inline.
+        source = '|'.join(
+            f"(?P<{pii_type}>{self._scoped(pattern)})"
+            for pii_type, pattern, _ in self._patterns
+        )
+        self._combined = re.compile(source)
+        self._combined_ascii = self._compile_ascii(source) or self._combined
+    
+    @staticmethod
+    def _compile_ascii(source: str) -> Any:
+        """
+        Compile with RE2 for use on ASCII-only text, or None.
+        
+        RE2's \\b, \\s and case folding only know ASCII, so on other text
+        it would miss PII that re finds (e.g. a phone number split by
+        no-break spaces). Returns None when RE2 is unavailable or rejects
+        the pattern.
+        """
+        if HAS_RE2:
+            try:
+                return re2.compile(PrivacyService._re2_source(source))
+            except re2.error:
+                pass
+        return None
+    
+    @staticmethod
+    def _re2_source(source: str) -> str:
+        """
+        Pattern source with \\s spelled out, so RE2 matches what re does.
+        
+        On ASCII text the engines only disagree on \\s: RE2 does not treat
+        \\v (Word's soft line break) or \\x1c-\\x1f as whitespace.
+        """
+        out = []
+        in_class = False
+        i = 0
+        while i < len(source):
+            char = source[i]
+            if char == '\\':
+                escape = source[i:i + 2]
+                if escape == r'\s':
+                    out.append(ASCII_WHITESPACE if in_class else f'[{ASCII_WHITESPACE}]')
+                else:
+                    out.append(escape)
+                i += 2
+                continue
+            if char == '[':
+                in_class = True
+            elif char == ']':
+                in_class = False
+            out.append(char)
+            i += 1
+        return ''.join(out)
+    
+    def __reduce__(self):
+        # Rebuild from the options when pickled for pool workers; compiled
+        # RE2 patterns cannot be pickled directly
+        return (PrivacyService, (set(self.redact_types), self.replacement_format))
+    
+    @staticmethod
+    def _scoped(pattern: re.Pattern) -> str:
+        """Pattern source with its IGNORECASE flag applied inline."""
+        if pattern.flags & re.IGNORECASE:
+            return f"(?i:{pattern.pattern})"
+        return pattern.pattern
     
     def process(self, chat: UniversalChat) -> UniversalChat:
         """
@@ -96,18 +217,15 @@ class PrivacyService:
         redacted_messages = []
         
         for msg in chat.messages:
-            redacted_text = self._redact_text(msg.text)
+            redacted_text = self.redact_text(msg.text)
             
-            redacted_messages.append(Message(
-                id=msg.id,
-                role=msg.role,
-                text=redacted_text,
-                timestamp=msg.timestamp,
-                metadata=msg.metadata
-            ))
+            # Messages without PII are shared rather than copied
+            if redacted_text != msg.text:
+                msg = replace(msg, text=redacted_text)
+            redacted_messages.append(msg)
         
         # Also redact title if needed
-        redacted_title = self._redact_text(chat.title)
+        redacted_title = self.redact_text(chat.title)
         
         return UniversalChat(
             id=chat.id,
@@ -121,20 +239,25 @@ class PrivacyService:
             token_count=chat.token_count
         )
     
-    def _redact_text(self, text: str) -> str:
-        """Apply PII redaction to text."""
-        if not text:
-            return ""
+    def redact_text(self, text: str) -> str:
+        """
+        Apply PII redaction to text.
         
-        result = text
+        This is the per-message step of process, also used by
+        FusedProcessor.
         
-        for pii_type in self.redact_types:
-            pattern = PII_PATTERNS.get(pii_type)
-            if pattern:
-                replacement = self.replacement_format.format(type=pii_type.upper())
-                result = pattern.sub(replacement, result)
+        Args:
+            text: Text to redact
+            
+        Returns:
+            Text with every PII match replaced
+        """
+        if not text:
+            return ""
         
-        return result
+        replacements = self._replacements
+        pattern = self._combined_ascii if text.isascii() else self._combined
+        return pattern.sub(lambda m: replacements[m.lastgroup], text)
     
     def detect(self, text: str) -> dict[str, List[str]]:
         """
@@ -148,15 +271,25 @@ class PrivacyService:
         """
         findings = {}
         
-        for pii_type in self.redact_types:
-            pattern = PII_PATTERNS.get(pii_type)
-            if pattern:
-                matches = pattern.findall(text)
-                if matches:
-                    findings[pii_type] = matches
+        for pii_type, pattern, _ in self._patterns:
+            matches = pattern.findall(text)
+            if matches:
+                findings[pii_type] = matches
         
         return findings
     
-    def process_batch(self, chats: List[UniversalChat]) -> List[UniversalChat]:
-        """Process multiple conversations."""
-        return [self.process(chat) for chat in chats]
+    def process_batch(self, chats: List[UniversalChat], workers: int = 1) -> List[UniversalChat]:
+        """
+        Process multiple conversations.
+        
+        With workers other than 1, large batches are spread over a process
+        pool; see parallel.process_batch for what that requires of callers.
+        
+        Args:
+            chats: Conversations to process
+            workers: Worker processes to use (1 = serial, 0 = CPU count)
+            
+        Returns:
+            Processed conversations, in input order
+        """
+        return parallel.process_batch(self, chats, workers)
@@ -5,11 +5,17 @@ This processor uses RAKE (Rapid Automatic Keyword Extraction) algorithm
 to extract tags without any LLM API calls.
 """
 
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from collections import Counter
+from dataclasses import replace
+from hashlib import blake2b
+from heapq import nlargest
+from operator import itemgetter
 import re
+import sys
 
-from klaros.models import UniversalChat
+from klaros.models import UniversalChat, Message, MessageRole
+from klaros.processors import parallel
 
 # Try to import rake_nltk, fall back to simple extraction if not available
 try:
@@ -18,6 +24,38 @@ try:
 except ImportError:
     HAS_RAKE = False
 
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+# Tag results remembered per tagger, keyed by a digest of the corpus text
+TAG_CACHE_SIZE = 4096
+
+# Keyword tokens for the frequency fallback, matched on lowercased text
+WORD_PATTERN = re.compile(r'\b[a-z]{3,}\b')
+
+# RE2 only knows ASCII word boundaries, so it is used on ASCII text alone,
+# where it finds exactly the same words as WORD_PATTERN
+ASCII_WORD_PATTERN = re2.compile(r'\b[a-z]{3,}\b') if HAS_RE2 else WORD_PATTERN
+
+# Sort key for (word, count) pairs
+COUNT = itemgetter(1)
+
+# Common words never used as tags
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all',
+    'can', 'had', 'her', 'was', 'one', 'our', 'out', 'has',
+    'have', 'been', 'were', 'being', 'their', 'there', 'this',
+    'that', 'with', 'would', 'could', 'should', 'what', 'from',
+    'they', 'will', 'when', 'where', 'which', 'while', 'into',
+    'some', 'then', 'than', 'them', 'these', 'your', 'just',
+    'like', 'make', 'know', 'think', 'take', 'want', 'does',
+    'about', 'also', 'more', 'other', 'only', 'very', 'here',
+})
+
 
 class TaggerService:
     """
@@ -51,6 +89,14 @@ class TaggerService:
         self.use_user_messages = use_user_messages
         self.use_assistant_messages = use_assistant_messages
         
+        # Roles whose messages feed the corpus, cached on the flags they
+        # were derived from
+        self._roles_key: Optional[tuple] = None
+        self._roles: FrozenSet[MessageRole] = frozenset()
+        
+        # Corpus digest (plus options) -> tags, oldest entries evicted first
+        self._tag_cache: dict[tuple, List[str]] = {}
+        
         # Initialize RAKE if available
         self._rake = None
         if HAS_RAKE:
@@ -63,6 +109,22 @@ class TaggerService:
             except Exception:
                 pass
     
+    @property
+    def _allowed_roles(self) -> FrozenSet[MessageRole]:
+        """Roles whose messages feed the corpus, following the use_* flags."""
+        key = (self.use_user_messages, self.use_assistant_messages)
+        if key != self._roles_key:
+            self._roles = frozenset(
+                role
+                for role, wanted in (
+                    (MessageRole.USER, self.use_user_messages),
+                    (MessageRole.ASSISTANT, self.use_assistant_messages),
+                )
+                if wanted
+            )
+            self._roles_key = key
+        return self._roles
+    
     def process(self, chat: UniversalChat) -> UniversalChat:
         """
         Extract tags from a conversation.
@@ -79,39 +141,79 @@ class TaggerService:
         if self.use_title and chat.title:
             text_parts.append(chat.title)
         
-        for msg in chat.messages:
-            if msg.role == "user" and self.use_user_messages:
-                text_parts.append(msg.text)
-            elif msg.role == "assistant" and self.use_assistant_messages:
-                text_parts.append(msg.text)
-        
-        full_text = " ".join(text_parts)
+        allowed_roles = self._allowed_roles
+        text_parts.extend(msg.text for msg in chat.messages if msg.role in allowed_roles)
         
         # Extract tags
-        if self._rake:
-            tags = self._extract_with_rake(full_text)
-        else:
-            tags = self._extract_simple(full_text)
-        
-        return UniversalChat(
-            id=chat.id,
-            source=chat.source,
-            source_file=chat.source_file,
-            title=chat.title,
-            created_at=chat.created_at,
-            updated_at=chat.updated_at,
-            messages=chat.messages,
-            tags=tags,
-            token_count=chat.token_count
-        )
+        tags = self.extract_tags(text_parts)
+        
+        return replace(chat, tags=tags)
+    
+    def wants(self, msg: Message) -> bool:
+        """Whether a message's text belongs in the tagging corpus."""
+        return msg.role in self._allowed_roles
+    
+    def extract_tags(self, parts: List[str]) -> List[str]:
+        """
+        Extract tags from the corpus parts (title and message texts).
+        
+        process builds the parts from a chat's title and the messages
+        accepted by wants; FusedProcessor does the same.
+        
+        The parts are analysed as they are, never joined into one string.
+        Extraction is deterministic, so results are memoized on a digest
+        of the parts; re-tagging the same conversation is a dict lookup.
+        The digest keeps the cache from holding on to corpus strings.
+        
+        Args:
+            parts: Texts to analyse
+            
+        Returns:
+            Extracted tags (a new list the caller owns)
+        """
+        # Nothing to analyse (no parts, or only whitespace): skip the
+        # digest and the extractors, which would find no tags either way
+        if not any(map(str.strip, parts)):
+            return []
+        
+        hasher = blake2b(digest_size=16)
+        for part in parts:
+            encoded = part.encode('utf-8', 'surrogatepass')
+            # Length-prefix each part so different splits never collide
+            hasher.update(len(encoded).to_bytes(8, 'little'))
+            hasher.update(encoded)
+        key = (hasher.digest(), self.max_tags, self.min_keyword_length)
+        
+        tags = self._tag_cache.get(key)
+        if tags is None:
+            if self._rake:
+                tags = self._extract_with_rake(parts)
+            else:
+                tags = self._extract_simple(parts)
+            
+            # The same few tags recur across an export; intern them so
+            # every chat shares one string object per tag
+            tags = list(map(sys.intern, tags))
+            
+            if len(self._tag_cache) >= TAG_CACHE_SIZE:
+                del self._tag_cache[next(iter(self._tag_cache))]
+            self._tag_cache[key] = tags
+        
+        # Callers own the returned list
+        return list(tags)
     
-    def _extract_with_rake(self, text: str) -> List[str]:
-        """Extract keywords using RAKE algorithm."""
-        if not text or not self._rake:
+    def _extract_with_rake(self, parts: List[str]) -> List[str]:
+        """
+        Extract keywords using RAKE algorithm.
+        
+        Each part is handed to RAKE as its own sentence, so phrases never
+        span two messages.
+        """
+        if not parts or not self._rake:
             return []
         
         try:
-            self._rake.extract_keywords_from_text(text)
+            self._rake.extract_keywords_from_sentences(parts)
             phrases = self._rake.get_ranked_phrases()
             
             # Filter and clean phrases
@@ -135,38 +237,52 @@ class TaggerService:
             
             return tags
         except Exception:
-            return self._extract_simple(text)
+            return self._extract_simple(parts)
     
-    def _extract_simple(self, text: str) -> List[str]:
+    def _extract_simple(self, parts: List[str]) -> List[str]:
         """Simple word frequency based extraction (fallback)."""
-        if not text:
+        if not parts:
             return []
         
-        # Tokenize and clean
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-        
-        # Remove common stop words
-        stop_words = {
-            'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all',
-            'can', 'had', 'her', 'was', 'one', 'our', 'out', 'has',
-            'have', 'been', 'were', 'being', 'their', 'there', 'this',
-            'that', 'with', 'would', 'could', 'should', 'what', 'from',
-            'they', 'will', 'when', 'where', 'which', 'while', 'into',
-            'some', 'then', 'than', 'them', 'these', 'your', 'just',
-            'like', 'make', 'know', 'think', 'take', 'want', 'does',
-            'about', 'also', 'more', 'other', 'only', 'very', 'here',
-        }
-        
-        filtered_words = [w for w in words if w not in stop_words]
-        
-        # Count frequencies
-        word_counts = Counter(filtered_words)
+        # Tokenize, drop stop words and count frequencies in one pass. One
+        # lower() per part is cheaper than lowering each token, and it also
+        # folds characters such as U+0130 and U+212A to ASCII as before.
+        word_counts = Counter(
+            w
+            for part in parts
+            for w in _find_words(part.lower())
+            if w not in STOP_WORDS
+        )
         
-        # Get most common
-        tags = [word for word, _ in word_counts.most_common(self.max_tags)]
+        # Get most common. Long texts have a long tail of words seen once;
+        # when enough words repeat to fill every tag slot, that tail cannot
+        # reach the top and is dropped before ranking. Like most_common,
+        # ties keep first-seen order, so the tags are the same either way.
+        candidates = [item for item in word_counts.items() if item[1] > 1]
+        if len(candidates) < self.max_tags:
+            candidates = word_counts.items()
+        tags = [word for word, _ in nlargest(self.max_tags, candidates, key=COUNT)]
         
         return tags
     
-    def process_batch(self, chats: List[UniversalChat]) -> List[UniversalChat]:
-        """Process multiple conversations."""
-        return [self.process(chat) for chat in chats]
+    def process_batch(self, chats: List[UniversalChat], workers: int = 1) -> List[UniversalChat]:
+        """
+        Process multiple conversations.
+        
+        With workers other than 1, large batches are spread over a process
+        pool; see parallel.process_batch for what that requires of callers.
+        
+        Args:
+            chats: Conversations to process
+            workers: Worker processes to use (1 = serial, 0 = CPU count)
+            
+        Returns:
+            Processed conversations, in input order
+        """
+        return parallel.process_batch(self, chats, workers)
+
+
+def _find_words(text: str) -> List[str]:
+    """Find keyword tokens in lowercased text, using RE2 when it applies."""
+    pattern = ASCII_WORD_PATTERN if text.isascii() else WORD_PATTERN
+    return pattern.findall(text)
@@ -0,0 +1,68 @@
+"""Tests for the Aspendos exporter's chunk output."""
+
+import json
+
+import pytest
+
+from klaros.exporters.aspendos_exporter import AspendosExporter
+from klaros.exporters.base import dumps_json
+from klaros.models import Message, MessageRole, SourcePlatform, UniversalChat
+
+
+TEXTS = [
+    "plain text",
+    'quotes " and \\ backslashes',
+    "control \x00\x1f\t\n\r characters",
+    "100% of %s and %d placeholders",
+    "caf\xe9, \u2028 line separator, emoji \U0001F600",
+    "x" * 300,
+]
+
+
+def _chat(chat_id='conv "1"', tags=("python", "caf\xe9")):
+    roles = list(MessageRole)
+    return UniversalChat(
+        id=chat_id,
+        source=SourcePlatform.CLAUDE,
+        title="Chunks",
+        tags=list(tags),
+        messages=[
+            Message(id=f"m{i}", role=roles[i % len(roles)], text=text)
+            for i, text in enumerate(TEXTS * 3)
+        ],
+    )
+
+
+@pytest.mark.parametrize("chunk_size", [1, 40, 4096])
+def test_encoded_chunks_match_built_chunks(chunk_size):
+    exporter = AspendosExporter(chunk_size=chunk_size)
+    chat = _chat()
+    conversation_id = dumps_json(chat.id)
+    tags = dumps_json(chat.tags)
+    
+    windows = list(exporter._iter_windows(chat))
+    assert windows
+    for chunk_id, (text, message_ids) in enumerate(windows, 7):
+        built = exporter._build_chunk(
+            chunk_id=chunk_id,
+            conversation_id=chat.id,
+            text=text,
+            message_ids=message_ids,
+            tags=chat.tags,
+        )
+        encoded = exporter._encode_chunk(chunk_id, conversation_id, text, message_ids, tags)
+        assert encoded == dumps_json(built)
+
+
+def test_streamed_chunks_match_export_single(tmp_path):
+    exporter = AspendosExporter(chunk_size=40)
+    chats = [_chat("a"), _chat("b", tags=())]
+    output = tmp_path / "import.json"
+    
+    exporter.export(chats, output)
+    streamed = json.loads(output.read_bytes())
+    
+    expected = []
+    for chat in chats:
+        expected.extend(exporter._iter_chunks(chat, len(expected)))
+    assert streamed["chunks"] == expected
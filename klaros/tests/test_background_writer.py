@@ -0,0 +1,43 @@
+"""Tests for the exporters' bounded background writer."""
+
+import threading
+
+import pytest
+
+from klaros.exporters.base import BackgroundWriter
+
+
+def test_submit_waits_once_the_limit_is_reached():
+    release = threading.Event()
+    lock = threading.Lock()
+    queued = 0
+    peak = 0
+    
+    def write():
+        nonlocal queued
+        release.wait(5)
+        with lock:
+            queued -= 1
+    
+    with BackgroundWriter(limit=3) as writer:
+        for i in range(10):
+            with lock:
+                queued += 1
+                peak = max(peak, queued)
+            if i == 2:
+                # Let the first writes finish so later submits can proceed
+                threading.Timer(0.05, release.set).start()
+            writer.submit(write)
+        assert len(writer._pending) <= 3
+    
+    assert peak <= 4
+    assert queued == 0
+
+
+def test_write_errors_are_raised_on_exit():
+    def fail():
+        raise OSError("disk full")
+    
+    with pytest.raises(OSError, match="disk full"):
+        with BackgroundWriter() as writer:
+            writer.submit(fail)
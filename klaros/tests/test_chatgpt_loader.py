@@ -0,0 +1,80 @@
+"""Tests for the ChatGPT loader's tree walk."""
+
+import pytest
+
+from klaros.loaders import chatgpt_loader
+from klaros.loaders.chatgpt_loader import ChatGPTLoader, ROLE_MAP
+
+
+def _node(node_id, parent, children, message=None):
+    return {"id": node_id, "parent": parent, "children": children, "message": message}
+
+
+def _message(msg_id, role, parts, content_type="text", **extra):
+    return {
+        "id": msg_id,
+        "author": {"role": role},
+        "content": {"content_type": content_type, "parts": parts},
+        **extra,
+    }
+
+
+THREAD = {
+    "root": _node("root", None, ["a"]),
+    "a": _node("a", "root", ["b", "branch"], _message(
+        "m-a", "user", ["  hello ", {"text": "from a dict part"}, {"text": ""}, 7],
+        create_time=1700000000.5,
+    )),
+    "branch": _node("branch", "a", [], _message("m-branch", "assistant", ["not followed"])),
+    "b": _node("b", "a", ["c"], _message(
+        "m-b", "assistant", ["answer"], metadata={"model_slug": "gpt-4o"},
+    )),
+    "c": _node("c", "b", ["d"], _message("m-c", "tool", ["tool output"])),
+    "d": _node("d", "c", ["e"], _message("m-d", "system", ["print()"], content_type="code")),
+    "e": _node("e", "d", ["f"], _message(
+        "m-e", "system", ["hidden"], metadata={"is_visually_hidden_from_conversation": True},
+    )),
+    "f": _node("f", "e", ["g"], _message(None, "user", ["null id"], create_time=None)),
+    "g": _node("g", "f", ["h"], _message("m-g", "user", ["   "])),
+    "h": _node("h", "g", ["i"], {"author": "user", "content": {}}),
+    "i": _node("i", "h", ["j"], {"id": "m-i", "author": {"role": "user"}}),
+    "j": _node("j", "i", ["k"], _message("m-j", "user", ["editable"], content_type="user_editable_context")),
+    "k": _node("k", "j", None, _message("m-k", "assistant", ["last"])),
+}
+
+CYCLE = {
+    "root": _node("root", None, ["x"]),
+    "x": _node("x", "root", ["y"], _message("m-x", "user", ["ping"])),
+    "y": _node("y", "x", ["x"], _message("m-y", "assistant", ["pong"])),
+}
+
+MISSING_CHILD = {
+    "root": _node("root", None, ["x"]),
+    "x": _node("x", "root", ["gone"], _message("m-x", "user", ["only message"])),
+}
+
+NO_PARENT_KEY = {
+    "root": {"id": "root", "children": ["x"]},
+    "x": _node("x", "root", [], _message("m-x", "user", ["orphan root"])),
+}
+
+
+@pytest.mark.skipif(chatgpt_loader.fast_traverse is None, reason="_chatgpt_fast extension not built")
+@pytest.mark.parametrize("mapping", [THREAD, CYCLE, MISSING_CHILD, NO_PARENT_KEY],
+                         ids=["thread", "cycle", "missing-child", "no-parent-key"])
+def test_fast_traverse_matches_python_walk(mapping):
+    loader = ChatGPTLoader()
+    root = loader._find_root(mapping)
+    
+    expected = loader._walk_records(mapping, root)
+    assert chatgpt_loader.fast_traverse(mapping, root, ROLE_MAP) == expected
+    assert expected
+
+
+def test_walk_skips_unwanted_messages():
+    loader = ChatGPTLoader()
+    records = loader._walk_records(THREAD, THREAD["root"])
+    
+    assert [record[2] for record in records] == [
+        "hello \nfrom a dict part", "answer", "null id", "editable", "last",
+    ]
@@ -0,0 +1,93 @@
+"""Tests for the klaros convert command."""
+
+import json
+import os
+import stat
+
+import pytest
+from typer.testing import CliRunner
+
+from klaros.cli import app
+from klaros.exporters.base import OUTPUT_FILE_MODE
+from klaros.exporters.json_exporter import JSONExporter
+
+
+CHATGPT_EXPORT = [
+    {
+        "id": "conv-1",
+        "title": "Python packaging",
+        "create_time": 1700000000.0,
+        "mapping": {
+            "root": {"id": "root", "parent": None, "children": ["m1"], "message": None},
+            "m1": {
+                "id": "m1",
+                "parent": "root",
+                "children": [],
+                "message": {
+                    "id": "m1",
+                    "author": {"role": "user"},
+                    "content": {"content_type": "text", "parts": ["How do wheels work?"]},
+                    "create_time": 1700000001.0,
+                },
+            },
+        },
+    }
+]
+
+
+def _convert(input_file, output, fmt):
+    return CliRunner().invoke(app, [
+        "convert", str(input_file), "-s", "chatgpt", "-f", fmt, "-w", "1", "-o", str(output)
+    ])
+
+
+@pytest.mark.parametrize("fmt", ["json", "aspendos"])
+def test_failed_convert_leaves_existing_output_unchanged(tmp_path, fmt):
+    good_input = tmp_path / "good.json"
+    good_input.write_text(json.dumps(CHATGPT_EXPORT * 50))
+    output = tmp_path / "export.json"
+    
+    result = _convert(good_input, output, fmt)
+    assert result.exit_code == 0, result.output
+    exported = output.read_bytes()
+    json.loads(exported)
+    
+    # Truncated input fails partway through the stream
+    bad_input = tmp_path / "bad.json"
+    bad_input.write_text(good_input.read_text()[:-200])
+    
+    result = _convert(bad_input, output, fmt)
+    assert result.exit_code == 1
+    assert "Error reading file" in result.output
+    assert output.read_bytes() == exported
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bad.json", "export.json", "good.json"]
+
+
+@pytest.mark.parametrize("error", [TypeError("not serializable"), ValueError("bad chat")])
+def test_export_failures_exit_cleanly(tmp_path, monkeypatch, error):
+    def fail(self, chat, sink):
+        raise error
+    
+    monkeypatch.setattr(JSONExporter, "write_incremental", fail)
+    input_file = tmp_path / "good.json"
+    input_file.write_text(json.dumps(CHATGPT_EXPORT))
+    
+    result = _convert(input_file, tmp_path / "export.json", "json")
+    assert result.exit_code == 1
+    assert "Error exporting" in result.output
+    assert str(error) in result.output
+    assert isinstance(result.exception, SystemExit)
+
+
+def test_output_gets_default_mode_without_touching_umask(tmp_path, monkeypatch):
+    input_file = tmp_path / "good.json"
+    input_file.write_text(json.dumps(CHATGPT_EXPORT))
+    output = tmp_path / "export.json"
+    
+    def forbidden(mask):
+        raise AssertionError("umask changed during export")
+    
+    monkeypatch.setattr(os, "umask", forbidden)
+    result = _convert(input_file, output, "json")
+    assert result.exit_code == 0, result.output
+    assert stat.S_IMODE(output.stat().st_mode) == OUTPUT_FILE_MODE
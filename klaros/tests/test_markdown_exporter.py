@@ -0,0 +1,33 @@
+"""Tests for Markdown export file naming."""
+
+import unicodedata
+
+from klaros.exporters.markdown_exporter import MarkdownExporter
+from klaros.models import Message, MessageRole, SourcePlatform, UniversalChat
+
+
+def _chat(title):
+    return UniversalChat(
+        source=SourcePlatform.CLAUDE,
+        title=title,
+        messages=[Message(id="m1", role=MessageRole.USER, text=f"about {title}")],
+    )
+
+
+def test_titles_differing_only_by_case_get_distinct_files(tmp_path):
+    MarkdownExporter().export([_chat("Python help"), _chat("python help")], tmp_path)
+    
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == ["Python help.md", "python help_1.md"]
+
+
+def test_existing_files_differing_by_case_or_normalization_are_kept(tmp_path):
+    composed = unicodedata.normalize("NFC", "Caf\xe9")
+    decomposed = unicodedata.normalize("NFD", composed)
+    (tmp_path / "NOTES.md").write_text("keep me")
+    
+    MarkdownExporter().export([_chat("notes"), _chat(composed), _chat(decomposed)], tmp_path)
+    
+    assert (tmp_path / "NOTES.md").read_text() == "keep me"
+    names = {unicodedata.normalize("NFC", p.name) for p in tmp_path.iterdir()}
+    assert names == {"NOTES.md", "notes_1.md", f"{composed}.md", f"{composed}_1.md"}
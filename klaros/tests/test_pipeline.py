@@ -0,0 +1,45 @@
+"""Tests for the fused processing pipeline."""
+
+from klaros.models import Message, MessageRole, SourcePlatform, UniversalChat
+from klaros.processors import CleanerService, FusedProcessor, PrivacyService, TaggerService
+
+
+def _chat():
+    return UniversalChat(
+        id="conv-1",
+        source=SourcePlatform.CHATGPT,
+        title="Mail bob@example.com about python packaging",
+        messages=[
+            Message(id="m1", role=MessageRole.USER, text="<b>Python</b>   packaging\n\n\n\nwheels? call 555-123-4567"),
+            Message(id="m2", role=MessageRole.ASSISTANT, text="As an AI language model, I can help.\nWheels are python packages."),
+            Message(id="m3", role=MessageRole.SYSTEM, text="system prompt"),
+            Message(id="m4", role=MessageRole.USER, text="   "),
+            Message(id="m5", role=MessageRole.USER, text="python wheels packaging again"),
+        ],
+    )
+
+
+def test_fused_matches_services_in_sequence():
+    cleaner = CleanerService(remove_system_messages=True)
+    privacy = PrivacyService()
+    tagger = TaggerService(use_assistant_messages=True)
+    
+    expected = tagger.process(privacy.process(cleaner.process(_chat())))
+    fused = FusedProcessor(cleaner=cleaner, privacy=privacy, tagger=tagger).process(_chat())
+    
+    assert fused == expected
+    assert fused.tags
+
+
+def test_tagger_role_flags_apply_after_construction():
+    tagger = TaggerService()
+    assistant = Message(id="m2", role=MessageRole.ASSISTANT, text="answer")
+    assert not tagger.wants(assistant)
+    
+    tagger.use_assistant_messages = True
+    tagger.use_user_messages = False
+    assert tagger.wants(assistant)
+    assert not tagger.wants(Message(id="m1", role=MessageRole.USER, text="question"))
+    assert tagger.process(_chat()) == TaggerService(
+        use_user_messages=False, use_assistant_messages=True,
+    ).process(_chat())
@@ -0,0 +1,43 @@
+"""Tests for PII redaction."""
+
+import pickle
+
+import pytest
+
+from klaros.processors import privacy
+from klaros.processors.privacy import PrivacyService
+
+
+@pytest.fixture(params=["re", "re2"])
+def service(request, monkeypatch):
+    """PrivacyService built with RE2 available or not."""
+    if request.param == "re2":
+        monkeypatch.setattr(privacy, "re2", pytest.importorskip("re2"), raising=False)
+        monkeypatch.setattr(privacy, "HAS_RE2", True)
+    else:
+        monkeypatch.setattr(privacy, "HAS_RE2", False)
+    return PrivacyService()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("call 555-123-4567 now", "call [REDACTED_PHONE] now"),
+    ("call 555\xa0123\xa04567 now", "call [REDACTED_PHONE] now"),
+    ("caf\xe9 bob@example.com", "caf\xe9 [REDACTED_EMAIL]"),
+    ("ssn\u2003123-45-6789", "ssn\u2003[REDACTED_SSN]"),
+    ("call 555\x0b555\x0b5555", "call [REDACTED_PHONE]"),
+    ("ssn 123\x0b45\x0b6789", "ssn [REDACTED_SSN]"),
+    ("key api_key\x1f" + "a" * 24, "key [REDACTED_API_KEY]"),
+])
+def test_redacts_around_unusual_whitespace(service, text, expected):
+    assert service.redact_text(text) == expected
+
+
+def test_reassigned_options_apply_in_process_and_in_workers(service):
+    text = "mail bob@example.com or call 555-123-4567"
+    service.redact_types = {"email"}
+    service.replacement_format = "<{type}>"
+    
+    assert service.redact_text(text) == "mail <EMAIL> or call 555-123-4567"
+    assert pickle.loads(pickle.dumps(service)).redact_text(text) == service.redact_text(text)
+    with pytest.raises(ValueError):
+        service.redact_types = {"email", "passport"}
@@ -0,0 +1,51 @@
+"""Tests for message timestamps surviving load and export."""
+
+import json
+import time
+
+import pytest
+
+from klaros.exporters import get_exporter
+from klaros.loaders.claude_loader import ClaudeLoader
+
+
+CLAUDE_CONVERSATION = {
+    "uuid": "conv-1",
+    "name": "Timestamps",
+    "created_at": "2025-04-22T21:19:10.000000Z",
+    "chat_messages": [
+        {
+            "uuid": "m1",
+            "text": "hello",
+            "sender": "human",
+            "created_at": "2025-04-22T21:19:16.151531Z",
+        },
+        {
+            "uuid": "m2",
+            "text": "hi",
+            "sender": "assistant",
+            "created_at": "2025-04-22T23:19:16.5+02:00",
+        },
+    ],
+}
+
+
+@pytest.fixture(params=["UTC", "America/Los_Angeles", "Asia/Kolkata"])
+def local_tz(request, monkeypatch):
+    """Run the test with the process in the given local time zone."""
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_claude_timestamps_keep_their_offset(local_tz):
+    chat = ClaudeLoader().parse_conversation(CLAUDE_CONVERSATION, "conversations.json")
+    exported = json.loads(get_exporter("json").export_single(chat))
+    
+    assert [m["timestamp"] for m in exported["messages"]] == [
+        "2025-04-22T21:19:16.151531+00:00",
+        "2025-04-22T23:19:16.500000+02:00",
+    ]
+    assert exported["created_at"] == "2025-04-22T21:19:10+00:00"
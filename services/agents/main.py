@@ -13,7 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, Literal
-import json
+import orjson
 
 from core.config import get_settings
 from providers.llm import list_available_models
@@ -74,6 +74,11 @@ class MCPServerRequest(BaseModel):
     url: str
 
 
+def sse_event(event: dict) -> bytes:
+    """Encode an event as a Server-Sent Events data frame."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
 # ============================================
 # Health & Info Endpoints
 # ============================================
@@ -142,7 +147,13 @@ async def chat(request: ChatRequest):
     Supports Auto, MAX, and Manual routing modes.
     Returns full response or streams tokens.
     """
-    messages = [{"role": m.role, "content": m.content} for m in request.messages]
+    # Convert messages, noting the last user message for routing on the way
+    messages = []
+    last_user_msg = ""
+    for m in request.messages:
+        messages.append({"role": m.role, "content": m.content})
+        if m.role == "user":
+            last_user_msg = m.content
     
     # Determine model via routing
     routing_config = RoutingConfig(
@@ -152,8 +163,6 @@ async def chat(request: ChatRequest):
         temperature=request.temperature,
     )
     
-    # Get last user message for routing decision
-    last_user_msg = next((m["content"] for m in reversed(messages) if m["role"] == "user"), "")
     routing_result = model_router.route(last_user_msg, routing_config)
     
     selected_model = routing_result.selected_model
@@ -161,7 +170,7 @@ async def chat(request: ChatRequest):
     if request.stream:
         async def generate():
             # Send routing info first
-            yield f"data: {json.dumps({'type': 'routing', 'model': selected_model, 'reason': routing_result.reason})}\n\n"
+            yield sse_event({'type': 'routing', 'model': selected_model, 'reason': routing_result.reason})
             
             async for event in stream_agent(
                 messages=messages,
@@ -170,7 +179,7 @@ async def chat(request: ChatRequest):
                 chat_id=request.chat_id,
                 include_mcp_tools=request.include_mcp_tools,
             ):
-                yield f"data: {json.dumps(event)}\n\n"
+                yield sse_event(event)
         
         return StreamingResponse(
             generate(),